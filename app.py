@@ -1,5 +1,4 @@
 import streamlit as st
-from streamlit import switch_page
 # Configuração da página (Deve ser a primeira linha)
 st.set_page_config(
     page_title="The Crew | Painel de Testes",
@@ -7,6 +6,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Aquece todas as abas das planilhas em segundo plano assim que o servidor sobe
+# (pandas/pyarrow/requests são importados nessa thread, não na renderização)
+from core.inicializacao import aquecer_em_segundo_plano
+aquecer_em_segundo_plano()
+
 # ====== ESTILIZAÇÃO CSS CUSTOMIZADA ======
 st.markdown("""
     <style>
@@ -0,0 +1,152 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Os módulos de core leem estas variáveis na importação: o benchmark roda
+# só com snapshots locais (nunca vai à rede) e sem atualização periódica.
+os.environ.setdefault("DASHBOARD_CACHE_DIR", tempfile.mkdtemp(prefix="dashboard-bench-"))
+os.environ["DASHBOARD_SNAPSHOT_TTL"] = "inf"
+os.environ["DASHBOARD_REFRESH_S"] = "0"
+
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from bench.sinteticos import gerar
+from core import atualizador, figuras, fontes, planilhas, snapshots
+from core.busca import construir_indice
+from core.estabilidade import ResumoVelocidades, tratar
+from core.giro import ERRO_FIXA, ERRO_PROPORCIONAL, adicionar_erros
+from core.missoes import juntar_missoes, resumo_missoes, tipos_por_missao
+from core.motores import colunas_motores, metricas_motores, preparar_leituras
+from core.rounds import IndiceRounds, colunas_missoes, matrizes_falhas
+from core.saidas import preparar, taxa_sucesso
+
+# ===================== BENCHMARK DAS PÁGINAS =====================
+# python -m bench.executar --tamanhos 100 10000 1000000 --saida bench_output.jsonl
+RAIZ = Path(__file__).resolve().parent.parent
+TAMANHOS = [100, 1_000, 10_000, 100_000]
+
+
+def _rounds(frames):
+    df = frames[planilhas.ROUNDS].copy()
+    df["Data"] = pd.to_datetime(df["Data"], dayfirst=True).dt.date
+    indice = IndiceRounds(df, colunas_missoes(df) + ["Total"])
+    i, j = indice.intervalo(df["Data"].min(), df["Data"].max())
+    indice.somas(i, j), indice.desvios(i, j)
+    matrizes_falhas(df, colunas_missoes(df))
+
+
+def _motores(frames):
+    df = preparar_leituras(frames[planilhas.MOTORES])
+    metricas_motores(df, colunas_motores(df))
+
+
+def _estabilidade(frames):
+    ResumoVelocidades().atualizar(tratar(frames[planilhas.ESTABILIDADE])).tabela()
+
+
+def _giro(frames):
+    df = adicionar_erros(frames[planilhas.GIRO])
+    df[ERRO_FIXA].mean(), df[ERRO_PROPORCIONAL].mean()
+
+
+def _pid(frames):
+    construir_indice(frames[planilhas.PID])
+
+
+def _missoes(frames):
+    longo = juntar_missoes({nome: frames[gid] for nome, gid in planilhas.MISSOES.items()})
+    resumo_missoes(longo), tipos_por_missao(longo)
+
+
+def _saidas(frames):
+    for df in frames.values():
+        taxa_sucesso(preparar(df))
+
+
+# página -> (abas que ela lê, transformação principal sem Streamlit)
+PAGINAS = {
+    "pages/teste_rounds.py": ([planilhas.ROUNDS], _rounds),
+    "pages/teste_motores.py": ([planilhas.MOTORES], _motores),
+    "pages/teste_estabilidade.py": ([planilhas.ESTABILIDADE], _estabilidade),
+    "pages/teste_giro.py": ([planilhas.GIRO], _giro),
+    "pages/teste_parametrospid.py": ([planilhas.PID], _pid),
+    "pages/teste_missoes.py": (list(planilhas.MISSOES.values()), _missoes),
+    "pages/teste_saidas.py": (list(planilhas.SAIDAS.values()), _saidas),
+}
+
+
+def _cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def _reiniciar_caches(gids):
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    # Atualizador só com as abas da página (todas com snapshot sintético):
+    # o padrão aqueceria as 25 abas e baixaria as que não têm snapshot
+    # enquanto a página é cronometrada
+    if atualizador._atualizador is not None:
+        atualizador._atualizador.parar()
+    atualizador._atualizador = atualizador.Atualizador(gids, intervalo=0)
+    # As versões recomeçam com o novo atualizador: figuras e consultas
+    # guardadas com as versões antigas não podem ser reaproveitadas
+    figuras._figuras.limpar()
+    fontes._consultas.limpar()
+
+
+def medir(pagina, linhas, timeout=600):
+    gids, transformar = PAGINAS[pagina]
+    for gid in gids:
+        snapshots.salvar(gid, gerar(gid, linhas))
+    _reiniciar_caches(gids)
+
+    medidas = {}
+    medidas["load"], frames = _cronometrar(lambda: {gid: snapshots.abrir(gid) for gid in gids})
+    medidas["transform"], _ = _cronometrar(lambda: transformar(frames))
+
+    app = AppTest.from_file(str(RAIZ / pagina), default_timeout=timeout)
+    medidas["render_frio"], _ = _cronometrar(app.run)
+    medidas["render_quente"], _ = _cronometrar(app.run)
+
+    erro = str(app.exception[0].value) if app.exception else None
+    return medidas, erro
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das páginas com dados sintéticos")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS)
+    parser.add_argument("--paginas", nargs="+", default=list(PAGINAS))
+    parser.add_argument("--saida", default="bench_output.jsonl")
+    parser.add_argument("--timeout", type=float, default=600)
+    args = parser.parse_args(argv)
+
+    with open(args.saida, "a", encoding="utf-8") as saida:
+        for linhas in args.tamanhos:
+            for pagina in args.paginas:
+                medidas, erro = medir(pagina, linhas, args.timeout)
+                for etapa, segundos in medidas.items():
+                    registro = {
+                        "pagina": pagina,
+                        "linhas": linhas,
+                        "etapa": etapa,
+                        "segundos": round(segundos, 6),
+                        "erro": erro,
+                        "quando": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    }
+                    saida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                resumo = "  ".join(f"{etapa}={s * 1000:.0f}ms" for etapa, s in medidas.items())
+                print(f"{pagina:32} {linhas:>9} linhas  {resumo}{'  ERRO: ' + erro if erro else ''}")
+                saida.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+from core import planilhas
+from core.rounds import MAXIMOS
+
+# ===================== DADOS SINTÉTICOS =====================
+# Cada gerador devolve a aba exatamente como ``pd.read_csv`` devolveria a
+# planilha publicada: mesmas colunas, mesmos formatos de texto ("90º",
+# "1,5", datas dd/mm/aaaa).
+
+
+def gerar_rounds(n, rng):
+    datas = pd.Timestamp("2025-01-01") + pd.to_timedelta(np.sort(rng.integers(0, max(n, 1), n)), unit="h")
+    df = pd.DataFrame({"Data": datas.strftime("%d/%m/%Y"), "Round": [f"R{i + 1}" for i in range(n)]})
+    for m, maximo in MAXIMOS.items():
+        df[m] = rng.choice(np.arange(0, maximo + 1, 5), n)
+    df["Total"] = df[list(MAXIMOS)].sum(axis=1)
+
+    obs = np.where(rng.random(n) < 0.05, "Ajuste no anexo da garra", None)
+    df["Observação"] = obs
+    # Sem links de imagem: o benchmark não depende do Google Drive
+    df["Antes"] = np.nan
+    df["Depois"] = np.nan
+    return df
+
+
+def gerar_motores(n, rng, motores=4):
+    alvo = rng.choice([90, 180, 360], n)
+    df = pd.DataFrame({"Rotação": [f"Rotação {i + 1}" for i in range(n)]})
+    simbolos = np.array(["º", "°", ""])
+    for k in range(motores):
+        leitura = alvo + rng.integers(-6, 7, n)
+        df[f"Motor {chr(65 + k)}"] = leitura.astype(str) + simbolos[rng.integers(0, 3, n)]
+    df["Alvo"] = alvo
+    return df
+
+
+def _virgula(valores, casas):
+    return pd.Series(np.round(valores, casas)).astype(str).str.replace(".", ",", regex=False)
+
+
+def gerar_estabilidade(n, rng):
+    velocidade = rng.choice([200, 300, 400, 500, 600, 800], n)
+    alvo = np.full(n, 500)
+    erro = rng.normal(0, 2 + velocidade / 200, n)
+    guinada = rng.normal(0, 1 + velocidade / 300, n)
+    return pd.DataFrame({
+        "Teste": np.arange(1, n + 1),
+        "Velocidade": velocidade,
+        "Distância Percorrida (mm)": _virgula(alvo + erro, 1),
+        "Distância Alvo (mm)": alvo,
+        "Erro de Movimento (mm)": _virgula(erro, 1),
+        "Guinada Final": _virgula(guinada, 1),
+        "Erro de Guinada": _virgula(np.abs(guinada), 1),
+        "Tempo": _virgula(3000 / velocidade + rng.random(n), 2),
+    })
+
+
+def gerar_giro(n, rng):
+    alvo = rng.choice([45, 90, 135, 180], n)
+    return pd.DataFrame({
+        "ID Teste": np.arange(1, n + 1),
+        "Alvo": alvo,
+        "Giro com Giroscópio": alvo + rng.integers(-8, 9, n),
+        "Tempo": np.round(1 + rng.random(n), 2),
+        "Giro Proporcional com Giroscópio": alvo + rng.integers(-3, 4, n),
+        "Tempo.1": np.round(0.6 + rng.random(n), 2),
+    })
+
+
+def gerar_missao(n, rng):
+    mudou = rng.random(n) < 0.2
+    return pd.DataFrame({
+        "ID Teste": np.arange(1, n + 1),
+        "Pontuação": rng.choice(np.arange(0, 45, 5), n),
+        "Tipo": rng.choice(["Código", "Mecânica", "Estratégia"], n),
+        "Resultado": rng.choice(["Sucesso", "Falha", "Parcial"], n),
+        "Mudança": np.where(mudou, "Troca do sensor de cor", None),
+    })
+
+
+def gerar_saida(n, rng):
+    mudou = rng.random(n) < 0.2
+    return pd.DataFrame({
+        "Nº Teste": np.arange(1, n + 1),
+        "pontuação": rng.integers(0, 120, n),
+        "mudança": np.where(mudou, "Novo trajeto", None),
+        "resultado": rng.choice(["Sucesso", "Falha", "OK"], n),
+    })
+
+
+def gerar_pid(n, rng):
+    mudou = rng.random(n) < 0.25
+    return pd.DataFrame({
+        "ID Teste": np.arange(1, n + 1),
+        "Data": (pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 300, n), unit="D")).strftime("%d/%m/%Y"),
+        "Alvo": rng.choice([45, 90, 180], n),
+        "KP": np.round(rng.random(n) * 3, 2),
+        "KI": np.round(rng.random(n) * 0.1, 3),
+        "KD": np.round(rng.random(n), 2),
+        "Mudança": np.where(mudou, "Aumentar KP", None),
+        "Resultado": rng.choice(["Bom", "Ruim", "Oscilou", "Lento"], n),
+        "Antes": "KP=1.0",
+        "Depois": "KP=1.2",
+    })
+
+
+GERADORES = {
+    planilhas.ROUNDS: gerar_rounds,
+    planilhas.MOTORES: gerar_motores,
+    planilhas.ESTABILIDADE: gerar_estabilidade,
+    planilhas.GIRO: gerar_giro,
+    planilhas.PID: gerar_pid,
+    **{gid: gerar_missao for gid in planilhas.MISSOES.values()},
+    **{gid: gerar_saida for gid in planilhas.SAIDAS.values()},
+}
+
+
+def gerar(gid, n, semente=0):
+    return GERADORES[gid](n, np.random.default_rng(semente))
@@ -0,0 +1,123 @@
+import os
+import threading
+import time
+
+from core import planilhas
+from core.cache import HASH_LINHAS, hash_linhas
+from core.fontes import fonte
+from core.memoria import bytes_frame, compactar
+
+# ===================== ATUALIZAÇÃO EM SEGUNDO PLANO =====================
+# Um único atualizador por processo mantém a última cópia boa de cada aba.
+# As páginas sempre leem dessa cópia; o download acontece numa thread e só
+# troca a cópia quando termina com sucesso (stale-while-revalidate).
+# Os frames são compartilhados entre sessões (st.cache_resource nas páginas)
+# e tratados como somente leitura: colunas derivadas saem de ``assign``,
+# que com copy-on-write (padrão a partir do pandas 3, exigido no
+# requirements.txt) não duplica as colunas originais.
+INTERVALO = float(os.environ.get("DASHBOARD_REFRESH_S", 300))
+
+GIDS = [
+    planilhas.ROUNDS,
+    planilhas.MOTORES,
+    planilhas.ESTABILIDADE,
+    planilhas.GIRO,
+    planilhas.PID,
+    *planilhas.MISSOES.values(),
+    *planilhas.SAIDAS.values(),
+]
+
+# Abas que as páginas consultam direto no banco quando a fonte filtra lá
+# (``core.fontes.consultar``): nesse caso não são carregadas inteiras.
+SOB_DEMANDA = {planilhas.MOTORES, planilhas.GIRO, planilhas.PID}
+
+
+class Atualizador:
+    def __init__(self, gids=GIDS, intervalo=INTERVALO):
+        self.gids = list(gids)
+        self.intervalo = intervalo
+        self.latencias = {}
+        self.erros = {}
+        self.atualizado_em = {}
+        self.memoria = {}
+        self._frames = {}
+        self._versoes = {}
+        self._lock = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = None
+
+    def iniciar(self):
+        """Aquece todas as abas e, se ``intervalo > 0``, continua re-consultando."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="atualizador-planilhas", daemon=True)
+            self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+
+    def _loop(self):
+        # Primeira passada aceita snapshots recentes; as seguintes vão à rede
+        self.atualizar(max_idade=planilhas.MAX_IDADE_SNAPSHOT)
+        if self.intervalo <= 0:
+            return
+        while not self._parar.wait(self.intervalo):
+            self.atualizar(max_idade=0)
+
+    def atualizar(self, gids=None, max_idade=0):
+        erros = {}
+        frames, latencias = planilhas.carregar_lote(
+            self.gids if gids is None else gids, max_idade=max_idade, erros=erros
+        )
+        with self._lock:
+            for gid, df in frames.items():
+                self._guardar(gid, df)
+            self.latencias.update(latencias)
+            self.erros.update(erros)
+            for gid in frames:
+                self.erros.pop(gid, None)
+
+    def _guardar(self, gid, df):
+        antes = bytes_frame(df)
+        df = compactar(df)
+        atual = self._frames.get(gid)
+        self.atualizado_em[gid] = time.time()
+        self.memoria[gid] = (antes, bytes_frame(df))
+        if atual is not None and atual.equals(df):
+            return
+        # Calculado uma vez por versão, aqui fora das páginas (ver ResumoIncremental)
+        df.attrs[HASH_LINHAS] = hash_linhas(df)
+        self._frames[gid] = df
+        self._versoes[gid] = self._versoes.get(gid, 0) + 1
+
+    def obter(self, gid):
+        """Última cópia boa da aba. Só bloqueia se ela nunca foi carregada."""
+        df = self._frames.get(gid)
+        if df is not None:
+            return df
+
+        inicio = time.perf_counter()
+        df = planilhas.carregar_aba(gid)
+        with self._lock:
+            if gid not in self._frames:
+                self._guardar(gid, df)
+                self.latencias[gid] = time.perf_counter() - inicio
+            return self._frames[gid]
+
+    def versao(self, gid):
+        """Muda sempre que o conteúdo da aba muda; serve de chave para caches."""
+        self.obter(gid)
+        return self._versoes[gid]
+
+
+_atualizador = None
+_lock = threading.Lock()
+
+
+def atualizador():
+    global _atualizador
+    with _lock:
+        if _atualizador is None:
+            gids = [g for g in GIDS if not (fonte().pushdown and g in SOB_DEMANDA)]
+            _atualizador = Atualizador(gids)
+            _atualizador.iniciar()
+    return _atualizador
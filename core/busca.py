@@ -0,0 +1,26 @@
+import pandas as pd
+
+# ===================== BUSCA TEXTUAL =====================
+# Em vez de converter cada célula a cada tecla digitada, o texto de todas as
+# colunas é concatenado (em minúsculas) uma vez por carga dos dados.
+SEPARADOR = "\x1f"
+
+
+def construir_indice(df):
+    """Série com o texto da linha inteira, alinhada ao índice de ``df``."""
+    if df.empty or len(df.columns) == 0:
+        return pd.Series("", index=df.index, dtype="string")
+
+    texto = df.astype(str)
+    indice = texto.iloc[:, 0]
+    for col in texto.columns[1:]:
+        indice = indice + SEPARADOR + texto[col]
+    return indice.str.lower().astype("string")
+
+
+def buscar(indice, consulta):
+    """Máscara das linhas que contêm todos os termos da consulta."""
+    mascara = pd.Series(True, index=indice.index)
+    for termo in consulta.lower().split():
+        mascara &= indice.str.contains(termo, regex=False).fillna(False)
+    return mascara
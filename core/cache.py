@@ -0,0 +1,64 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# ===================== CACHE LRU =====================
+
+
+class CacheLRU:
+    """Dicionário limitado a ``max_itens``; o item usado há mais tempo sai primeiro."""
+
+    def __init__(self, max_itens=64):
+        self.max_itens = max_itens
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+
+    def obter(self, chave, criar):
+        """Valor de ``chave``; se não existir, ``criar()`` é chamado e guardado."""
+        with self._lock:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave]
+            self.faltas += 1
+
+        valor = criar()
+        with self._lock:
+            self._itens[chave] = valor
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+        return valor
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+
+    def __len__(self):
+        return len(self._itens)
+
+
+# Atributo (``df.attrs``) em que o atualizador guarda o ``hash_linhas`` da aba
+HASH_LINHAS = "hash_linhas"
+MODULO_HASH = 2 ** 64
+
+
+def hash_linhas(df):
+    """Soma (mod 2**64) dos hashes de cada linha, sem o índice.
+
+    É aditivo: ``hash_linhas(df)`` é o de ``df.iloc[:n]`` mais o de
+    ``df.iloc[n:]``, então linhas novas entram sem re-hashear as antigas.
+    """
+    return int(pd.util.hash_pandas_object(df, index=False).to_numpy().sum(dtype=np.uint64))
+
+
+def hash_frame(df):
+    """Impressão digital do conteúdo de um DataFrame (valores, colunas e índice)."""
+    h = hashlib.sha1(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    h.update(repr(list(df.columns)).encode())
+    return h.hexdigest()
@@ -0,0 +1,130 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.cache import HASH_LINHAS, MODULO_HASH, hash_linhas
+from core.estatisticas import Acumulador
+
+# ===================== ESTABILIDADE =====================
+COLUNAS_OBRIGATORIAS = [
+    "Teste","Velocidade","Distância Percorrida (mm)",
+    "Distância Alvo (mm)","Erro de Movimento (mm)",
+    "Guinada Final","Erro de Guinada","Tempo"
+]
+
+COLUNAS_NUMERICAS = [
+    "Velocidade","Distância Percorrida (mm)","Distância Alvo (mm)",
+    "Erro de Movimento (mm)","Guinada Final","Erro de Guinada","Tempo"
+]
+
+# Colunas resumidas por velocidade, na ordem dos acumuladores
+MEDIDAS = ["Erro de Movimento (mm)", "Erro de Guinada", "Tempo"]
+
+
+def tratar(df):
+    """Converte as colunas numéricas ("1,5" → 1.5) e descarta testes incompletos."""
+    df = df.assign(**{
+        c: pd.to_numeric(
+            df[c].astype(str)
+            .str.replace(",", ".", regex=False)
+            .str.replace(" ", "", regex=False),
+            errors="coerce"
+        )
+        for c in COLUNAS_NUMERICAS
+    })
+
+    return df.dropna(subset=["Velocidade","Erro de Movimento (mm)","Erro de Guinada","Tempo"])
+
+
+class ResumoVelocidades:
+    """Acumuladores por velocidade: alimentados com testes novos e mescláveis.
+
+    Dois resumos calculados sobre partes disjuntas dos testes, combinados
+    com ``mesclar``, dão o mesmo resultado do ``groupby`` sobre o todo.
+    """
+
+    def __init__(self):
+        self.acumuladores = {}
+        self.testes = {}
+
+    def atualizar(self, df):
+        for velocidade, grupo in df.groupby("Velocidade", sort=False):
+            acumulador = self.acumuladores.setdefault(velocidade, Acumulador(len(MEDIDAS)))
+            acumulador.atualizar(grupo[MEDIDAS].to_numpy(dtype=float))
+            self.testes[velocidade] = self.testes.get(velocidade, 0) + int(grupo["Teste"].notna().sum())
+        return self
+
+    def mesclar(self, outro):
+        for velocidade, acumulador in outro.acumuladores.items():
+            self.acumuladores.setdefault(velocidade, Acumulador(len(MEDIDAS))).mesclar(acumulador)
+            self.testes[velocidade] = self.testes.get(velocidade, 0) + outro.testes[velocidade]
+        return self
+
+    def tabela(self):
+        velocidades = sorted(self.acumuladores)
+        acumuladores = [self.acumuladores[v] for v in velocidades]
+        media = np.array([a.media for a in acumuladores]).reshape(-1, len(MEDIDAS))
+        desvio = np.array([a.desvio for a in acumuladores]).reshape(-1, len(MEDIDAS))
+
+        summary = pd.DataFrame({
+            "Velocidade": velocidades,
+            "Erro_Medio_Mov": media[:, 0],
+            "Variacao_Mov": desvio[:, 0],
+            "Erro_Medio_Guinada": media[:, 1],
+            "Variacao_Guinada": desvio[:, 1],
+            "Tempo_Medio": media[:, 2],
+            "Tempo_Minimo": [a.minimo[2] for a in acumuladores],
+            "Tempo_Maximo": [a.maximo[2] for a in acumuladores],
+            "Testes": [self.testes[v] for v in velocidades],
+        }).fillna(0)
+
+        summary["Score_Estabilidade"] = (
+            summary["Erro_Medio_Mov"].abs()
+            + summary["Variacao_Mov"]
+            + summary["Erro_Medio_Guinada"].abs()
+            + summary["Variacao_Guinada"]
+        )
+
+        summary["Score_Desempenho"] = (
+            summary["Score_Estabilidade"] * 0.7
+            + summary["Tempo_Medio"] * 0.3
+        )
+        return summary
+
+
+class ResumoIncremental:
+    """Mantém um ``ResumoVelocidades`` em dia com uma planilha que só cresce.
+
+    Recebe a aba bruta: a cada nova versão só as linhas depois das já
+    processadas passam por ``tratar`` e entram nos acumuladores. O hash das
+    linhas processadas é acumulado; o hash da aba inteira vem pronto do
+    atualizador (``df.attrs``), então conferir que nenhuma linha antiga mudou
+    ou sumiu custa só o hash das linhas novas. Se mudou, o resumo é refeito.
+    """
+
+    def __init__(self):
+        self.resumo = ResumoVelocidades()
+        self.linhas = 0
+        self._hash = 0
+        self._lock = threading.Lock()
+
+    def sincronizar(self, bruto):
+        with self._lock:
+            n = self.linhas
+            novas = bruto.iloc[n:]
+            hash_novas = hash_linhas(novas)
+            if n:
+                total = bruto.attrs.get(HASH_LINHAS)
+                if total is None:
+                    total = hash_linhas(bruto)
+                if len(bruto) < n or (total - hash_novas) % MODULO_HASH != self._hash:
+                    self.resumo = ResumoVelocidades()
+                    self.linhas = self._hash = 0
+                    novas, hash_novas = bruto, total
+
+            if len(novas):
+                self.resumo.atualizar(tratar(novas))
+                self.linhas = len(bruto)
+                self._hash = (self._hash + hash_novas) % MODULO_HASH
+            return self.resumo.tabela()
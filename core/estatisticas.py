@@ -0,0 +1,66 @@
+import numpy as np
+
+# ===================== ESTATÍSTICAS INCREMENTAIS =====================
+
+
+class Acumulador:
+    """Contagem, média, variância (Welford/Chan), mínimo e máximo por coluna.
+
+    Recebe lotes de linhas com ``atualizar`` e pode ser combinado com outro
+    acumulador via ``mesclar`` — o resultado é o mesmo que processar todas
+    as linhas de uma vez. Valores NaN são ignorados.
+    """
+
+    def __init__(self, colunas=1):
+        self.n = np.zeros(colunas)
+        self.media = np.zeros(colunas)
+        self.m2 = np.zeros(colunas)
+        self.minimo = np.full(colunas, np.inf)
+        self.maximo = np.full(colunas, -np.inf)
+
+    @classmethod
+    def de_lote(cls, valores):
+        valores = np.asarray(valores, dtype=float)
+        if valores.ndim == 1:
+            valores = valores[:, None]
+
+        lote = cls(valores.shape[1])
+        validos = ~np.isnan(valores)
+        lote.n = validos.sum(axis=0).astype(float)
+        if not lote.n.any():
+            return lote
+
+        zerados = np.where(validos, valores, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            lote.media = np.where(lote.n > 0, zerados.sum(axis=0) / lote.n, 0.0)
+        desvios = np.where(validos, valores - lote.media, 0.0)
+        lote.m2 = (desvios ** 2).sum(axis=0)
+        lote.minimo = np.where(validos, valores, np.inf).min(axis=0)
+        lote.maximo = np.where(validos, valores, -np.inf).max(axis=0)
+        return lote
+
+    def atualizar(self, valores):
+        self.mesclar(Acumulador.de_lote(valores))
+        return self
+
+    def mesclar(self, outro):
+        n = self.n + outro.n
+        delta = outro.media - self.media
+        with np.errstate(invalid="ignore", divide="ignore"):
+            peso = np.where(n > 0, outro.n / n, 0.0)
+        self.media = self.media + delta * peso
+        self.m2 = self.m2 + outro.m2 + delta ** 2 * self.n * peso
+        self.n = n
+        self.minimo = np.minimum(self.minimo, outro.minimo)
+        self.maximo = np.maximum(self.maximo, outro.maximo)
+        return self
+
+    @property
+    def variancia(self):
+        """Variância amostral (ddof=1); NaN com menos de dois valores."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.n > 1, self.m2 / (self.n - 1), np.nan)
+
+    @property
+    def desvio(self):
+        return np.sqrt(self.variancia)
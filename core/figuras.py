@@ -0,0 +1,25 @@
+import os
+
+from core.cache import CacheLRU
+
+# ===================== CACHE DE FIGURAS =====================
+# Figuras Plotly prontas, compartilhadas entre sessões. Um rerun causado por
+# outro widget encontra a figura aqui e pula tanto o pandas quanto a
+# construção/validação do Plotly.
+MAX_FIGURAS = int(os.environ.get("DASHBOARD_FIGURAS_MAX", 64))
+
+_figuras = CacheLRU(max_itens=MAX_FIGURAS)
+
+
+def figura(chave, construir):
+    """Figura guardada sob ``chave``; ``construir()`` só roda se ela não estiver lá.
+
+    A chave deve reunir tudo de que a figura depende: o gráfico, a versão
+    dos dados e os filtros aplicados. A figura devolvida é compartilhada e
+    não deve ser alterada.
+    """
+    return _figuras.obter(chave, construir)
+
+
+def estatisticas():
+    return {"figuras": len(_figuras), "acertos": _figuras.acertos, "faltas": _figuras.faltas}
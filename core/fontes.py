@@ -0,0 +1,272 @@
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+from abc import ABC, abstractmethod
+from contextlib import closing
+from pathlib import Path
+
+import pandas as pd
+
+from core.cache import CacheLRU
+
+# ===================== FONTES DE DADOS =====================
+# De onde vêm as abas, escolhido por DASHBOARD_FONTE:
+#   planilha            planilha publicada do Google (padrão)
+#   csv:<diretório>     um <gid>.csv por aba, para rodar offline
+#   sqlite:<arquivo>    banco gerado por ``python -m core.fontes``, com
+#                       índices e filtros executados no próprio banco
+LINHA = "__linha"     # posição original da linha (chave primária no SQLite)
+SUFIXO_ISO = "__iso"  # coluna sombra "Data__iso" (AAAA-MM-DD) para intervalos
+INDICES = ["Data" + SUFIXO_ISO, "Alvo", "Resultado"]
+
+
+def filtrar(df, em=None, entre=None, linhas=None):
+    """Mesmos filtros de ``Fonte.consultar``, aplicados em memória.
+
+    ``em``: {coluna: valores aceitos}; ``entre``: {coluna: (inicio, fim)}
+    inclusivo; ``linhas``: (inicio, fim) por posição, como ``iloc``.
+    """
+    if linhas is not None:
+        df = df.iloc[linhas[0]:linhas[1]]
+    for coluna, valores in (em or {}).items():
+        df = df[df[coluna].isin(list(valores))]
+    for coluna, (inicio, fim) in (entre or {}).items():
+        df = df[(df[coluna] >= inicio) & (df[coluna] <= fim)]
+    return df
+
+
+class Fonte(ABC):
+    remota = False
+    pushdown = False
+
+    @abstractmethod
+    def ler(self, gid):
+        """Aba inteira como DataFrame."""
+
+    def consultar(self, gid, em=None, entre=None, linhas=None):
+        return filtrar(self.ler(gid), em, entre, linhas)
+
+    def contar(self, gid):
+        return len(self.ler(gid))
+
+    def colunas(self, gid):
+        return list(self.ler(gid).columns)
+
+    def distintos(self, gid, coluna):
+        return self.ler(gid)[coluna].dropna().unique().tolist()
+
+
+class FontePlanilha(Fonte):
+    """CSV publicado pela planilha (com snapshots em disco, ver ``core.planilhas``)."""
+    remota = True
+
+    def ler(self, gid):
+        from core import planilhas
+        return planilhas.baixar_aba(gid)
+
+
+class FonteCSV(Fonte):
+    def __init__(self, diretorio):
+        self.diretorio = Path(diretorio)
+
+    def ler(self, gid):
+        return pd.read_csv(self.diretorio / f"{gid}.csv")
+
+
+def _nome(coluna):
+    return '"' + str(coluna).replace('"', '""') + '"'
+
+
+def _tabela(gid):
+    return _nome(f"aba_{gid}")
+
+
+def _valor(v):
+    # numpy/pandas → tipos nativos do sqlite3; datas viram ISO
+    if hasattr(v, "isoformat"):
+        return v.isoformat()[:10]
+    return v.item() if hasattr(v, "item") else v
+
+
+class FonteSQLite(Fonte):
+    pushdown = True
+
+    def __init__(self, caminho):
+        self.caminho = Path(caminho)
+
+    def _conectar(self):
+        # as_uri() escapa espaços, "?" e "#" do caminho; mode=ro nunca cria o arquivo
+        return closing(sqlite3.connect(self.caminho.resolve().as_uri() + "?mode=ro", uri=True))
+
+    def _ler_sql(self, sql, parametros=()):
+        with self._conectar() as conexao:
+            df = pd.read_sql_query(sql, conexao, params=list(parametros), index_col=LINHA)
+        df.index.name = None
+        return df.drop(columns=[c for c in df.columns if c.endswith(SUFIXO_ISO)])
+
+    def versao(self):
+        """Muda sempre que o banco é regravado; serve de chave para os caches das páginas."""
+        return self.caminho.stat().st_mtime_ns
+
+    def ler(self, gid):
+        return self._ler_sql(f"SELECT * FROM {_tabela(gid)} ORDER BY {LINHA}")
+
+    def contar(self, gid):
+        with self._conectar() as conexao:
+            return conexao.execute(f"SELECT COUNT(*) FROM {_tabela(gid)}").fetchone()[0]
+
+    def colunas(self, gid):
+        with self._conectar() as conexao:
+            cursor = conexao.execute(f"SELECT * FROM {_tabela(gid)} LIMIT 0")
+            nomes = [d[0] for d in cursor.description]
+        return [c for c in nomes if c != LINHA and not c.endswith(SUFIXO_ISO)]
+
+    def distintos(self, gid, coluna):
+        sql = f"SELECT DISTINCT {_nome(coluna)} FROM {_tabela(gid)} WHERE {_nome(coluna)} IS NOT NULL"
+        with self._conectar() as conexao:
+            return [v for (v,) in conexao.execute(sql)]
+
+    def consultar(self, gid, em=None, entre=None, linhas=None):
+        condicoes, parametros = [], []
+        if linhas is not None:
+            condicoes.append(f"{LINHA} >= ? AND {LINHA} < ?")
+            parametros += [int(linhas[0]), int(linhas[1])]
+        for coluna, valores in (em or {}).items():
+            valores = [_valor(v) for v in valores]
+            condicoes.append(f"{_nome(coluna)} IN ({', '.join('?' * len(valores))})")
+            parametros += valores
+        for coluna, (inicio, fim) in (entre or {}).items():
+            # Datas da planilha (dd/mm/aaaa) só comparam pela coluna sombra ISO
+            if coluna == "Data":
+                coluna += SUFIXO_ISO
+            condicoes.append(f"{_nome(coluna)} BETWEEN ? AND ?")
+            parametros += [_valor(inicio), _valor(fim)]
+
+        where = f" WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        return self._ler_sql(f"SELECT * FROM {_tabela(gid)}{where} ORDER BY {LINHA}", parametros)
+
+
+def gravar_sqlite(caminho, frames):
+    """Grava {gid: df} no banco, com coluna ISO de ``Data`` e índices de filtro."""
+    # closing() fecha a conexão; o ``with conexao`` interno faz o commit
+    with closing(sqlite3.connect(caminho)) as conexao, conexao:
+        for gid, df in frames.items():
+            df = df.reset_index(drop=True)
+            if "Data" in df.columns:
+                datas = pd.to_datetime(df["Data"], dayfirst=True, errors="coerce")
+                df["Data" + SUFIXO_ISO] = datas.dt.strftime("%Y-%m-%d")
+            tabela = f"aba_{gid}"
+            conexao.execute(f"DROP TABLE IF EXISTS {_nome(tabela)}")
+            colunas = ", ".join(_nome(c) for c in df.columns)
+            conexao.execute(f"CREATE TABLE {_nome(tabela)} ({LINHA} INTEGER PRIMARY KEY, {colunas})")
+            df.to_sql(tabela, conexao, if_exists="append", index=True, index_label=LINHA)
+            for coluna in INDICES:
+                if coluna in df.columns:
+                    conexao.execute(
+                        f"CREATE INDEX {_nome(f'ix_{gid}_{coluna}')} ON {_nome(tabela)} ({_nome(coluna)})"
+                    )
+
+
+def gravar_csv(diretorio, frames):
+    diretorio = Path(diretorio)
+    diretorio.mkdir(parents=True, exist_ok=True)
+    for gid, df in frames.items():
+        df.to_csv(diretorio / f"{gid}.csv", index=False)
+
+
+def criar(especificacao):
+    tipo, _, alvo = especificacao.partition(":")
+    if tipo == "planilha":
+        return FontePlanilha()
+    if tipo == "csv" and alvo:
+        return FonteCSV(alvo)
+    if tipo == "sqlite" and alvo:
+        return FonteSQLite(alvo)
+    raise ValueError(f"Fonte de dados inválida: {especificacao!r}")
+
+
+_fonte = None
+_lock = threading.Lock()
+_consultas = CacheLRU(max_itens=32)
+
+
+def fonte():
+    """Fonte ativa do processo (DASHBOARD_FONTE)."""
+    global _fonte
+    with _lock:
+        if _fonte is None:
+            _fonte = criar(os.environ.get("DASHBOARD_FONTE", "planilha"))
+        return _fonte
+
+
+def _congelar(filtros):
+    return tuple(
+        (coluna, tuple(_valor(v) for v in valores))
+        for coluna, valores in sorted((filtros or {}).items())
+    )
+
+
+def consultar(gid, versao, base, preparar=None, em=None, entre=None, linhas=None):
+    """Linhas de ``gid`` que passam nos filtros.
+
+    Se a fonte filtra no banco, a consulta vai até ele (resultado guardado
+    por ``versao`` + filtros) e ``preparar`` é aplicado só às linhas
+    retornadas; ``base`` pode ser None (a aba nunca é carregada inteira) ou
+    limitar o resultado às suas linhas. Nas outras fontes os filtros rodam
+    em memória sobre ``base``, já preparado.
+    """
+    f = fonte()
+    if not f.pushdown:
+        return filtrar(base, em, entre, linhas)
+
+    chave = (gid, versao, _congelar(em), _congelar(entre), linhas)
+
+    def executar():
+        df = f.consultar(gid, em, entre, linhas)
+        return preparar(df) if preparar is not None else df
+
+    df = _consultas.obter(chave, executar)
+    if base is not None and len(df) and not df.index.isin(base.index).all():
+        df = df[df.index.isin(base.index)]
+    return df
+
+
+def contar(gid, versao):
+    """``fonte().contar`` guardado por versão: uma consulta por versão, não por rerun."""
+    return _consultas.obter(("contar", gid, versao), lambda: fonte().contar(gid))
+
+
+def colunas(gid, versao):
+    return _consultas.obter(("colunas", gid, versao), lambda: fonte().colunas(gid))
+
+
+def distintos(gid, versao, coluna):
+    return _consultas.obter(("distintos", gid, versao, coluna), lambda: fonte().distintos(gid, coluna))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Copia todas as abas para uma fonte local")
+    parser.add_argument("destino", help="sqlite:<arquivo> ou csv:<diretório>")
+    parser.add_argument("--origem", default="planilha", help="fonte de onde ler (padrão: planilha)")
+    args = parser.parse_args(argv)
+
+    from core.atualizador import GIDS
+
+    origem = criar(args.origem)
+    frames = {gid: origem.ler(gid) for gid in GIDS}
+
+    tipo, _, alvo = args.destino.partition(":")
+    if tipo == "sqlite" and alvo:
+        gravar_sqlite(alvo, frames)
+    elif tipo == "csv" and alvo:
+        gravar_csv(alvo, frames)
+    else:
+        parser.error(f"destino inválido: {args.destino!r}")
+    print(f"{len(frames)} abas gravadas em {args.destino} ({sum(map(len, frames.values()))} linhas)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+import pandas as pd
+
+# ===================== GIRO =====================
+ERRO_FIXA = "Erro Giro Velocidade Fixa (°)"
+ERRO_PROPORCIONAL = "Erro Giro Proporcional (°)"
+
+
+def adicionar_erros(df):
+    """Erro absoluto de cada tipo de giro em relação ao ``Alvo``."""
+    # A aba pode chegar com inteiros compactados (int8, ver ``core.memoria``):
+    # a subtração em float64 não dá a volta (90 - (-90) em int8 seria -76)
+    alvo = df["Alvo"].astype(float)
+    return df.assign(**{
+        ERRO_FIXA: (alvo - df["Giro com Giroscópio"].astype(float)).abs(),
+        ERRO_PROPORCIONAL: (alvo - df["Giro Proporcional com Giroscópio"].astype(float)).abs(),
+    })
+
+
+def resumo_por_alvo(df):
+    """Tempo e erro médios dos dois giros para cada ângulo alvo."""
+    return df.groupby("Alvo").agg(
+        Tempo_Medio_Fixa=("Tempo", "mean"),
+        Tempo_Medio_Proporcional=("Tempo.1", "mean"),
+        Erro_Medio_Fixa=(ERRO_FIXA, "mean"),
+        Erro_Medio_Proporcional=(ERRO_PROPORCIONAL, "mean"),
+        Testes=("Alvo", "size"),
+    ).reset_index()
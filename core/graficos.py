@@ -0,0 +1,158 @@
+import os
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from pandas.api.types import is_numeric_dtype
+
+# ===================== GRÁFICOS DE SÉRIES =====================
+# Acima de ORCAMENTO pontos cada série é reduzida com LTTB (Largest Triangle
+# Three Buckets) antes de ir para o navegador; acima de LIMIAR_WEBGL pontos o
+# gráfico usa traços WebGL (scattergl). Selecionar uma faixa com a caixa
+# refaz a redução só dentro dela, com resolução cheia quando couber.
+ORCAMENTO = int(os.environ.get("DASHBOARD_GRAFICO_PONTOS", 2000))
+LIMIAR_WEBGL = int(os.environ.get("DASHBOARD_GRAFICO_WEBGL", 1000))
+
+
+def lttb(x, y, n):
+    """Índices dos ``n`` pontos que preservam a forma da série (x crescente)."""
+    tamanho = len(x)
+    if n >= tamanho or n < 3:
+        return np.arange(tamanho)
+
+    indices = np.empty(n, dtype=np.int64)
+    indices[0], indices[-1] = 0, tamanho - 1
+    limites = np.linspace(1, tamanho - 1, n - 1).astype(np.int64)
+
+    a = 0
+    for k in range(n - 2):
+        ini, fim = limites[k], limites[k + 1]
+        prox_fim = limites[k + 2] if k + 2 < n - 1 else tamanho
+        mx = x[fim:prox_fim].mean()
+        my = y[fim:prox_fim].mean()
+
+        xs, ys = x[ini:fim], y[ini:fim]
+        area = np.abs((x[a] - mx) * (ys - y[a]) - (x[a] - xs) * (my - y[a]))
+        a = ini + int(np.argmax(area))
+        indices[k + 1] = a
+
+    return indices
+
+
+def _eixo_numerico(serie):
+    """Eixo x como float: números, datas em ns, ou a posição para categorias."""
+    if is_numeric_dtype(serie):
+        return serie.to_numpy(dtype=float)
+    try:
+        datas = pd.to_datetime(serie)
+    except (TypeError, ValueError):
+        return np.arange(len(serie), dtype=float)
+    return datas.to_numpy(dtype="datetime64[ns]").astype(np.int64).astype(float)
+
+
+def _limite_numerico(serie, valor):
+    if is_numeric_dtype(serie) or isinstance(valor, (int, float)):
+        return float(valor)
+    return float(pd.Timestamp(valor).as_unit("ns").value)
+
+
+def reduzir(df, x, y, color=None, orcamento=ORCAMENTO):
+    """Reduz cada série (coluna de ``y`` × grupo de ``color``) para caber no orçamento."""
+    colunas = [y] if isinstance(y, str) else list(y)
+    if len(df) * len(colunas) <= orcamento:
+        return df
+
+    grupos = list(df.groupby(color, sort=False, observed=True)) if color else [(None, df)]
+    por_serie = max(3, orcamento // (len(grupos) * len(colunas)))
+
+    partes = []
+    for _, grupo in grupos:
+        eixo = _eixo_numerico(grupo[x])
+        ordem = np.argsort(eixo, kind="stable")
+        manter = np.zeros(len(grupo), dtype=bool)
+        for col in colunas:
+            valores = grupo[col].to_numpy(dtype=float)[ordem]
+            validos = np.flatnonzero(~np.isnan(valores))
+            escolhidos = validos[lttb(eixo[ordem][validos], valores[validos], por_serie)]
+            manter[ordem[escolhidos]] = True
+        partes.append(grupo[manter])
+
+    return pd.concat(partes)
+
+
+def linha(df, x, y, color=None, orcamento=ORCAMENTO, limiar_webgl=LIMIAR_WEBGL, **kwargs):
+    """``px.line`` com redução de pontos e WebGL automático para séries grandes."""
+    reduzido = reduzir(df, x, y, color=color, orcamento=orcamento)
+    colunas = 1 if isinstance(y, str) else len(y)
+    render_mode = "webgl" if len(reduzido) * colunas > limiar_webgl else "svg"
+    import plotly.express as px
+    return px.line(reduzido, x=x, y=y, color=color, render_mode=render_mode, **kwargs)
+
+
+# ---- zoom por seleção de caixa ----
+def _chave_zoom(key):
+    return f"{key}__zoom"
+
+
+def _guardar_zoom(key):
+    evento = st.session_state.get(key)
+    caixas = (evento or {}).get("selection", {}).get("box", [])
+    if caixas and caixas[0].get("x"):
+        x0, x1 = caixas[0]["x"][:2]
+        st.session_state[_chave_zoom(key)] = (x0, x1)
+
+
+def _limpar_zoom(key):
+    st.session_state.pop(_chave_zoom(key), None)
+
+
+def zoom_atual(key):
+    """Faixa selecionada no gráfico ``key`` (ou ``None``); serve de chave de cache."""
+    return st.session_state.get(_chave_zoom(key))
+
+
+def filtrar_zoom(df, x, key):
+    """Linhas dentro da faixa selecionada no gráfico ``key`` (ou ``df`` inteiro)."""
+    faixa = st.session_state.get(_chave_zoom(key))
+    if faixa is None:
+        return df
+
+    st.button("🔎 Mostrar tudo", key=f"{key}__reset", on_click=_limpar_zoom, args=(key,))
+    eixo = _eixo_numerico(df[x])
+    inicio, fim = sorted(_limite_numerico(df[x], v) for v in faixa)
+    return df[(eixo >= inicio) & (eixo <= fim)]
+
+
+def mostrar_grafico(fig, key):
+    """Exibe o gráfico; selecionar uma faixa com a caixa aplica o zoom no servidor."""
+    # Figuras podem vir do cache compartilhado: só altera se ainda não estiver assim
+    if fig.layout.dragmode != "select":
+        fig.update_layout(dragmode="select", selectdirection="h")
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        key=key,
+        on_select=lambda: _guardar_zoom(key),
+        selection_mode="box",
+    )
+
+
+# ---- matplotlib ----
+def png_matplotlib(cache, chave, desenhar, figsize, dpi=120):
+    """PNG de um gráfico matplotlib, guardado em ``cache`` sob ``chave``.
+
+    Usa ``Figure`` direto (sem pyplot), então nada fica registrado no
+    gerenciador global de figuras; a figura é limpa assim que vira PNG.
+    """
+    def criar():
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize, dpi=dpi)
+        desenhar(fig.subplots())
+        saida = BytesIO()
+        fig.savefig(saida, format="png", bbox_inches="tight", dpi=200)
+        fig.clear()
+        return saida.getvalue()
+
+    return cache.obter(chave, criar)
@@ -0,0 +1,134 @@
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import requests
+from PIL import Image
+
+from core import planilhas, snapshots
+
+# ===================== CACHE DE IMAGENS =====================
+# Miniaturas já redimensionadas ficam em disco, endereçadas pelo hash de
+# (arquivo do Drive, largura). O cache é LRU: cada acerto renova o mtime e,
+# quando o diretório passa de MAX_BYTES, os arquivos mais antigos saem.
+DIRETORIO = snapshots.CACHE_DIR / "imagens"
+MAX_BYTES = int(float(os.environ.get("DASHBOARD_IMAGENS_MAX_MB", 200)) * 1024 * 1024)
+LARGURA = 280
+# Guarda o dobro da largura exibida para telas de alta densidade
+ESCALA = 2
+MAX_DOWNLOADS = 8
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+_ID_DRIVE = re.compile(r"/d/([\w-]+)|[?&]id=([\w-]+)")
+_lock_remocao = threading.Lock()
+
+
+def id_drive(url):
+    if not isinstance(url, str):
+        return None
+    m = _ID_DRIVE.search(url)
+    if m is None:
+        return None
+    return m.group(1) or m.group(2)
+
+
+def _caminho(file_id, largura):
+    chave = hashlib.sha256(f"{file_id}:{largura}".encode()).hexdigest()
+    return DIRETORIO / chave[:2] / f"{chave}.img"
+
+
+def _ler(caminho):
+    try:
+        conteudo = caminho.read_bytes()
+    except FileNotFoundError:
+        return None
+    os.utime(caminho)
+    return conteudo
+
+
+def miniatura(conteudo, largura=LARGURA):
+    """Reduz a imagem para ``largura * ESCALA`` px de largura e devolve os bytes."""
+    img = Image.open(BytesIO(conteudo))
+    alvo = (largura * ESCALA, largura * ESCALA * 4)
+    # JPEG pode ser decodificado direto em escala reduzida
+    img.draft("RGB", alvo)
+    img.thumbnail(alvo)
+
+    saida = BytesIO()
+    if img.mode in ("RGBA", "LA", "P"):
+        img.save(saida, format="PNG", optimize=True)
+    else:
+        img.convert("RGB").save(saida, format="JPEG", quality=85)
+    return saida.getvalue()
+
+
+def _baixar(file_id, largura):
+    url = f"https://drive.google.com/uc?export=download&id={file_id}"
+    try:
+        r = planilhas.sessao().get(url, headers=HEADERS, timeout=planilhas.TIMEOUT)
+    except requests.RequestException:
+        return None
+    if r.status_code != 200:
+        return None
+
+    try:
+        conteudo = miniatura(r.content, largura)
+    except (OSError, Image.DecompressionBombError):
+        return None
+
+    caminho = _caminho(file_id, largura)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    tmp = caminho.with_suffix(f".{threading.get_ident()}.tmp")
+    tmp.write_bytes(conteudo)
+    os.replace(tmp, caminho)
+    return conteudo
+
+
+def _remover_antigos():
+    with _lock_remocao:
+        arquivos = []
+        total = 0
+        for caminho in DIRETORIO.glob("*/*.img"):
+            try:
+                info = caminho.stat()
+            except FileNotFoundError:
+                continue
+            arquivos.append((info.st_mtime, info.st_size, caminho))
+            total += info.st_size
+
+        arquivos.sort()
+        for _, tamanho, caminho in arquivos:
+            if total <= MAX_BYTES:
+                break
+            caminho.unlink(missing_ok=True)
+            total -= tamanho
+
+
+def carregar_miniaturas(urls, largura=LARGURA):
+    """Miniaturas para uma lista de links do Drive: url -> bytes (ou ``None``).
+
+    Acertos vêm do disco; faltas são baixadas em paralelo pela sessão compartilhada.
+    """
+    resultado = {}
+    faltando = {}
+    for url in dict.fromkeys(urls):
+        file_id = id_drive(url)
+        if file_id is None:
+            resultado[url] = None
+            continue
+        conteudo = _ler(_caminho(file_id, largura))
+        if conteudo is None:
+            faltando[url] = file_id
+        else:
+            resultado[url] = conteudo
+
+    if faltando:
+        with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOADS, len(faltando))) as pool:
+            baixados = pool.map(lambda file_id: _baixar(file_id, largura), faltando.values())
+            resultado.update(zip(faltando.keys(), baixados))
+        _remover_antigos()
+
+    return resultado
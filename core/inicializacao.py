@@ -0,0 +1,114 @@
+import ast
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+# ===================== INICIALIZAÇÃO =====================
+# Só biblioteca padrão aqui: este módulo é importado pela página inicial e
+# não pode trazer pandas/plotly junto.
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Orçamento (ms) para as importações feitas no topo de cada página, medidas
+# num interpretador novo com ``python -m core.inicializacao``.
+ORCAMENTOS_MS = {
+    "app.py": 100,
+    "pages/teste_estabilidade.py": 800,
+    "pages/teste_giro.py": 800,
+    "pages/teste_missoes.py": 800,
+    "pages/teste_motores.py": 800,
+    "pages/teste_parametrospid.py": 800,
+    "pages/teste_reta.py": 100,
+    "pages/teste_rounds.py": 800,
+    "pages/teste_saidas.py": 800,
+}
+
+_aquecido = False
+_lock = threading.Lock()
+
+
+def aquecer_em_segundo_plano():
+    """Inicia o atualizador das planilhas sem segurar a renderização da página.
+
+    Só a primeira chamada do processo dispara a thread; os reruns da página
+    inicial não fazem nada.
+    """
+    global _aquecido
+    with _lock:
+        if _aquecido:
+            return
+        _aquecido = True
+
+    def aquecer():
+        from core.atualizador import atualizador
+        atualizador()
+
+    threading.Thread(target=aquecer, name="aquecer-planilhas", daemon=True).start()
+
+
+# ---- medição fora do Streamlit ----
+def importacoes_do_topo(caminho):
+    """Módulos importados no nível do módulo (executados sempre que a página abre)."""
+    arvore = ast.parse(Path(caminho).read_text(encoding="utf-8"))
+    modulos = []
+    for no in arvore.body:
+        if isinstance(no, ast.Import):
+            modulos.extend(alias.name for alias in no.names)
+        elif isinstance(no, ast.ImportFrom) and no.module:
+            modulos.append(no.module)
+    return list(dict.fromkeys(modulos))
+
+
+# O servidor já tem o Streamlit carregado antes de abrir qualquer página
+_BASE = ["streamlit"]
+
+_MEDIDOR = """
+import json, sys, time
+for m in sys.argv[1:{base}]:
+    __import__(m)
+tempos = {{}}
+for m in sys.argv[{base}:]:
+    inicio = time.perf_counter()
+    __import__(m)
+    tempos[m] = (time.perf_counter() - inicio) * 1000
+print(json.dumps(tempos))
+"""
+
+
+def medir_importacoes(modulos):
+    """Custo a frio de importar ``modulos``, em ordem, num interpretador novo.
+
+    Retorna ``(total_ms, {modulo: ms})``; cada módulo conta só o que ainda
+    não tinha sido carregado pelos anteriores.
+    """
+    resultado = subprocess.run(
+        [sys.executable, "-c", _MEDIDOR.format(base=len(_BASE) + 1), *_BASE, *modulos],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    por_modulo = json.loads(resultado.stdout.strip().splitlines()[-1])
+    return sum(por_modulo.values()), por_modulo
+
+
+def relatorio(paginas=None):
+    """Mede todas as páginas; retorna linhas ``(pagina, total_ms, orcamento_ms, maiores)``."""
+    linhas = []
+    for pagina in paginas or ORCAMENTOS_MS:
+        total, por_modulo = medir_importacoes(importacoes_do_topo(RAIZ / pagina))
+        maiores = sorted(por_modulo.items(), key=lambda item: -item[1])[:4]
+        linhas.append((pagina, total, ORCAMENTOS_MS.get(pagina), maiores))
+    return linhas
+
+
+def main():
+    estourou = False
+    for pagina, total, orcamento, maiores in relatorio(sys.argv[1:] or None):
+        ok = orcamento is None or total <= orcamento
+        estourou |= not ok
+        detalhe = ", ".join(f"{m} {ms:.0f}ms" for m, ms in maiores)
+        print(f"{'OK ' if ok else 'ACIMA'} {pagina:32} {total:7.0f} ms / {orcamento} ms  [{detalhe}]")
+    return 1 if estourou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
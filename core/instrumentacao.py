@@ -0,0 +1,172 @@
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+from core.snapshots import CACHE_DIR
+
+# ===================== INSTRUMENTAÇÃO =====================
+# Cada página marca suas etapas (carregar, filtros, tabela, gráficos...) e
+# o tempo de cada uma é medido por execução do script. No fim da execução:
+#   .cache/metricas/execucoes.jsonl   uma linha por execução (página, sessão, etapas)
+#   .cache/metricas/dashboard.prom    totais acumulados no formato texto do Prometheus
+# DASHBOARD_METRICAS=0 desliga a exportação (o painel na barra lateral continua).
+# Ao passar de DASHBOARD_METRICAS_MAX_MB, execucoes.jsonl vira execucoes.jsonl.1
+# (substituindo o anterior) e recomeça vazio.
+# Fragmentos (st.fragment) que reexecutam sozinhos viram execuções próprias,
+# com o nome "<página>/<seção>" (ver ``fragmento``).
+
+DIRETORIO = CACHE_DIR / "metricas"
+EXPORTAR = os.environ.get("DASHBOARD_METRICAS", "1") != "0"
+MAX_BYTES = int(float(os.environ.get("DASHBOARD_METRICAS_MAX_MB", 10)) * 1024 * 1024)
+
+_CHAVE = "__instrumentacao"
+_totais = {}  # (pagina, etapa) -> [execuções, segundos]
+_lock = threading.Lock()
+
+
+def _sessao():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx is not None else "local"
+    except ImportError:
+        return "local"
+
+
+def iniciar(pagina, etapa="layout"):
+    """Abre o registro desta execução; a primeira etapa é ``etapa``."""
+    st.session_state[_CHAVE] = {
+        "pagina": pagina,
+        "sessao": _sessao(),
+        "inicio": time.perf_counter(),
+        "etapas": [[etapa, time.perf_counter(), None]],
+    }
+
+
+def marcar(etapa):
+    """Fecha a etapa atual e começa ``etapa``."""
+    execucao = st.session_state.get(_CHAVE)
+    if execucao is None:
+        return
+    agora = time.perf_counter()
+    if execucao["etapas"][-1][2] is None:
+        execucao["etapas"][-1][2] = agora
+    execucao["etapas"].append([etapa, agora, None])
+
+
+def fragmento(pagina, secao):
+    """Decorador para a função de um ``st.fragment`` (aplicado abaixo dele).
+
+    Na execução completa as marcas do fragmento entram no registro da página.
+    Quando só o fragmento reexecuta, esse registro já foi fechado por
+    ``finalizar``: a função ganha um registro próprio, "<pagina>/<secao>".
+    """
+    def decorar(funcao):
+        @functools.wraps(funcao)
+        def executar(*args, **kwargs):
+            if _CHAVE in st.session_state:
+                return funcao(*args, **kwargs)
+            iniciar(f"{pagina}/{secao}", etapa=secao)
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                # O painel fica na barra lateral, fora do alcance do fragmento
+                finalizar(painel=False)
+        return executar
+    return decorar
+
+
+def _tempos(execucao):
+    agora = time.perf_counter()
+    resultado = {}
+    for nome, inicio, fim in execucao["etapas"]:
+        resultado[nome] = resultado.get(nome, 0.0) + ((fim or agora) - inicio)
+    return resultado
+
+
+def tempos():
+    """{etapa: segundos} da execução atual (etapas repetidas são somadas)."""
+    execucao = st.session_state.get(_CHAVE)
+    return {} if execucao is None else _tempos(execucao)
+
+
+def _escapar(texto):
+    return str(texto).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _gravar_prometheus():
+    linhas = [
+        "# HELP dashboard_etapa_segundos Tempo gasto em cada etapa das páginas.",
+        "# TYPE dashboard_etapa_segundos summary",
+    ]
+    for (pagina, etapa), (n, soma) in sorted(_totais.items()):
+        rotulos = f'pagina="{_escapar(pagina)}",etapa="{_escapar(etapa)}"'
+        linhas.append(f"dashboard_etapa_segundos_count{{{rotulos}}} {n}")
+        linhas.append(f"dashboard_etapa_segundos_sum{{{rotulos}}} {soma:.6f}")
+    destino = DIRETORIO / "dashboard.prom"
+    temporario = destino.with_suffix(".tmp")
+    temporario.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+    os.replace(temporario, destino)
+
+
+def _rotacionar(caminho):
+    try:
+        if caminho.stat().st_size >= MAX_BYTES:
+            os.replace(caminho, caminho.with_name(caminho.name + ".1"))
+    except FileNotFoundError:
+        pass
+
+
+def _exportar(execucao, etapas, total):
+    registro = {
+        "quando": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "pagina": execucao["pagina"],
+        "sessao": execucao["sessao"],
+        "total": round(total, 6),
+        "etapas": {nome: round(s, 6) for nome, s in etapas.items()},
+    }
+    with _lock:
+        for nome, s in etapas.items():
+            acumulado = _totais.setdefault((execucao["pagina"], nome), [0, 0.0])
+            acumulado[0] += 1
+            acumulado[1] += s
+        try:
+            DIRETORIO.mkdir(parents=True, exist_ok=True)
+            _rotacionar(DIRETORIO / "execucoes.jsonl")
+            with open(DIRETORIO / "execucoes.jsonl", "a", encoding="utf-8") as arquivo:
+                arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            _gravar_prometheus()
+        except OSError:
+            pass
+
+
+def finalizar(painel=True):
+    """Fecha a execução: exporta os tempos e mostra o painel, se ligado.
+
+    Deve ser chamada no fim da página e antes de cada ``st.stop()``.
+    """
+    execucao = st.session_state.pop(_CHAVE, None)
+    if execucao is None:
+        return
+    etapas = _tempos(execucao)
+    total = time.perf_counter() - execucao["inicio"]
+    if EXPORTAR:
+        _exportar(execucao, etapas, total)
+
+    if painel and st.sidebar.toggle("⏱️ Tempo por etapa", key="__instrumentacao_painel"):
+        import pandas as pd
+
+        st.sidebar.dataframe(
+            pd.DataFrame({
+                "Etapa": list(etapas),
+                "ms": [round(s * 1000, 1) for s in etapas.values()],
+            }),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.sidebar.caption(f"Total da execução: {total * 1000:.0f} ms")
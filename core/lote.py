@@ -0,0 +1,175 @@
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+from core import planilhas
+from core.snapshots import CACHE_DIR
+
+# ===================== AGREGADOS EM LOTE =====================
+# Pré-calcula os resumos de cada página sem abrir o Streamlit:
+#   python -m core.lote [--saida DIR] [--tarefas rounds giro ...]
+# Cada tarefa roda num processo próprio e devolve DataFrames; o processo
+# principal grava cada um como Parquet e JSON, mais um manifest.json.
+DIRETORIO = CACHE_DIR / "agregados"
+
+
+def _rounds():
+    from core.rounds import IndiceRounds, colunas_missoes, matrizes_falhas, precisao_missoes
+
+    df = planilhas.carregar_aba(planilhas.ROUNDS)
+    df = df.assign(Data=pd.to_datetime(df["Data"], dayfirst=True, errors="coerce"))
+    colunas = colunas_missoes(df)
+    indice = IndiceRounds(df, colunas)
+    i, j = 0, len(indice.df)
+    missoes = [c for c in colunas if c.startswith("M")]
+    resumo = pd.DataFrame({
+        "Média": indice.medias(i, j),
+        "Desvio": indice.desvios(i, j),
+        "Testes": indice.contagens(i, j),
+    }).rename_axis("Coluna").reset_index()
+    precisao = precisao_missoes(indice, i, j).rename("Precisão (%)").rename_axis("Missão").reset_index()
+    correlacao, condicional = matrizes_falhas(df, missoes)
+    return {
+        "rounds_resumo": resumo,
+        "rounds_precisao": precisao,
+        "rounds_correlacao": correlacao.rename_axis("Missão").reset_index(),
+        "rounds_condicional": condicional.rename_axis("Missão").reset_index(),
+    }
+
+
+def _motores():
+    from core.motores import colunas_motores, metricas_motores, preparar_leituras
+
+    df = preparar_leituras(planilhas.carregar_aba(planilhas.MOTORES))
+    return {"motores_metricas": metricas_motores(df, colunas_motores(df))}
+
+
+def _estabilidade():
+    from core.estabilidade import ResumoVelocidades, tratar
+
+    resumo = ResumoVelocidades()
+    resumo.atualizar(tratar(planilhas.carregar_aba(planilhas.ESTABILIDADE)))
+    return {"estabilidade_resumo": resumo.tabela()}
+
+
+def _giro():
+    from core.giro import adicionar_erros, resumo_por_alvo
+
+    df = adicionar_erros(planilhas.carregar_aba(planilhas.GIRO))
+    return {"giro_resumo": resumo_por_alvo(df)}
+
+
+def _missoes():
+    from core.missoes import juntar_missoes, resumo_missoes, tipos_por_missao
+
+    frames, _ = planilhas.carregar_lote(planilhas.MISSOES.values())
+    longo = juntar_missoes({nome: frames[gid] for nome, gid in planilhas.MISSOES.items()})
+    return {
+        "missoes_resumo": resumo_missoes(longo),
+        "missoes_tipos": tipos_por_missao(longo),
+    }
+
+
+def _saidas():
+    from core.saidas import preparar, taxa_sucesso
+
+    frames, _ = planilhas.carregar_lote(planilhas.SAIDAS.values())
+    linhas = []
+    for saida, gid in planilhas.SAIDAS.items():
+        df = preparar(frames[gid])
+        linhas.append({
+            "Saída": saida,
+            "Tentativas": len(df),
+            "Pontuação Média": df["Pontuação"].mean() if "Pontuação" in df.columns else None,
+            "Taxa de Sucesso (%)": taxa_sucesso(df),
+        })
+    return {"saidas_resumo": pd.DataFrame(linhas)}
+
+
+def _pid():
+    df = planilhas.carregar_aba(planilhas.PID)
+    if "Resultado" not in df.columns:
+        return {}
+    contagem = df["Resultado"].astype(str).value_counts().rename_axis("Resultado")
+    return {"pid_resultados": contagem.rename("Testes").reset_index()}
+
+
+TAREFAS = {
+    "rounds": _rounds,
+    "motores": _motores,
+    "estabilidade": _estabilidade,
+    "giro": _giro,
+    "missoes": _missoes,
+    "saidas": _saidas,
+    "pid": _pid,
+}
+
+
+def _executar(nome):
+    inicio = time.perf_counter()
+    return TAREFAS[nome](), time.perf_counter() - inicio
+
+
+def gravar(nome, df, diretorio):
+    # Parquet para quem lê com pandas/pyarrow; JSON para o resto
+    df.columns = [str(c) for c in df.columns]
+    df.to_parquet(diretorio / f"{nome}.parquet", index=False)
+    df.to_json(diretorio / f"{nome}.json", orient="records", force_ascii=False, date_format="iso")
+
+
+def ler_agregado(nome, diretorio=DIRETORIO):
+    """Lê um agregado gravado por ``python -m core.lote``."""
+    return pd.read_parquet(Path(diretorio) / f"{nome}.parquet")
+
+
+def gerar(tarefas=None, diretorio=DIRETORIO, processos=None):
+    diretorio = Path(diretorio)
+    diretorio.mkdir(parents=True, exist_ok=True)
+    manifesto = {"gerado_em": time.strftime("%Y-%m-%dT%H:%M:%S"), "tarefas": {}}
+
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futuros = {executor.submit(_executar, nome): nome for nome in tarefas or TAREFAS}
+        for futuro in as_completed(futuros):
+            nome = futuros[futuro]
+            try:
+                agregados, segundos = futuro.result()
+            except Exception as erro:
+                manifesto["tarefas"][nome] = {"erro": f"{type(erro).__name__}: {erro}"}
+                continue
+            for chave, df in agregados.items():
+                gravar(chave, df, diretorio)
+            manifesto["tarefas"][nome] = {
+                "segundos": round(segundos, 3),
+                "agregados": {chave: len(df) for chave, df in agregados.items()},
+            }
+
+    with open(diretorio / "manifest.json", "w", encoding="utf-8") as arquivo:
+        json.dump(manifesto, arquivo, ensure_ascii=False, indent=2)
+    return manifesto
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-calcula os resumos de cada página")
+    parser.add_argument("--saida", default=str(DIRETORIO))
+    parser.add_argument("--tarefas", nargs="+", choices=list(TAREFAS), default=list(TAREFAS))
+    parser.add_argument("--processos", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    manifesto = gerar(args.tarefas, args.saida, args.processos)
+    falhou = False
+    for nome, info in sorted(manifesto["tarefas"].items()):
+        if "erro" in info:
+            falhou = True
+            print(f"ERRO {nome:14} {info['erro']}")
+        else:
+            print(f"OK   {nome:14} {info['segundos'] * 1000:7.0f} ms  {info['agregados']}")
+    return 1 if falhou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import pandas as pd
+
+# ===================== TIPOS COMPACTOS =====================
+# As abas chegam com int64/float64 e textos repetidos ("Sucesso", "Código",
+# datas...). Compactar uma vez na carga reduz o que fica em memória no
+# processo, compartilhado por todas as sessões.
+MAX_CATEGORIAS = 0.5  # vira categoria se valores distintos <= 50% das linhas
+
+
+def compactar(df):
+    """Cópia de ``df`` com inteiros no menor tipo e textos repetidos como categoria.
+
+    Floats não são reduzidos (float32 mudaria médias e desvios); textos com
+    muitos valores distintos ficam como string Arrow. Inteiros estreitos dão
+    a volta em contas (int8: 90 - (-90) == -76), então quem subtrai ou
+    multiplica colunas converte antes para float64 (ver ``core.giro``,
+    ``IndiceRounds`` e ``metricas_motores``).
+    """
+    colunas = {}
+    for col in df.columns:
+        serie = df[col]
+        if pd.api.types.is_bool_dtype(serie) or isinstance(serie.dtype, pd.CategoricalDtype):
+            continue
+        if pd.api.types.is_integer_dtype(serie):
+            colunas[col] = pd.to_numeric(serie, downcast="integer")
+        elif pd.api.types.is_object_dtype(serie) or pd.api.types.is_string_dtype(serie):
+            distintos = serie.nunique(dropna=True)
+            if len(serie) and distintos <= MAX_CATEGORIAS * len(serie):
+                colunas[col] = serie.astype("category")
+            elif pd.api.types.is_object_dtype(serie):
+                colunas[col] = serie.astype("string[pyarrow]")
+    return df.assign(**colunas) if colunas else df
+
+
+def bytes_frame(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+def relatorio(gids, nomes=None):
+    """Bytes de cada aba em memória antes e depois da compactação."""
+    from core.atualizador import atualizador
+
+    memoria = atualizador().memoria
+    linhas = []
+    for gid in gids:
+        antes, depois = memoria.get(gid, (0, 0))
+        linhas.append({
+            "Aba": (nomes or {}).get(gid, gid),
+            "Antes (KB)": round(antes / 1024, 1),
+            "Depois (KB)": round(depois / 1024, 1),
+            "Redução (%)": round((1 - depois / antes) * 100, 1) if antes else 0.0,
+        })
+    return pd.DataFrame(linhas)
+
+
+def painel_memoria(gids, nomes=None):
+    """Expander na barra lateral com o relatório de memória das abas da página."""
+    import streamlit as st
+
+    with st.sidebar.expander("💾 Memória por aba"):
+        tabela = relatorio(gids, nomes)
+        st.dataframe(tabela, hide_index=True, use_container_width=True)
+        st.caption(
+            f"Total: {tabela['Antes (KB)'].sum():.1f} KB → {tabela['Depois (KB)'].sum():.1f} KB"
+        )
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+# ===================== MISSÕES =====================
+COLUNAS = ["ID Teste", "Pontuação", "Tipo", "Resultado", "Mudança"]
+
+
+def juntar_missoes(frames):
+    """Empilha as abas de missão ({nome: df}) num único frame longo.
+
+    ``Missão`` é categórica, na ordem de ``frames``, para que os group-bys
+    mantenham M01..M15 em sequência.
+    """
+    partes = [df.reindex(columns=COLUNAS) for df in frames.values()]
+    longo = pd.concat(partes, ignore_index=True)
+    # Um código por aba, repetido pelo número de linhas dela
+    longo.insert(0, "Missão", pd.Categorical.from_codes(
+        np.repeat(np.arange(len(frames)), [len(df) for df in frames.values()]),
+        categories=list(frames),
+    ))
+    return longo.assign(**{"ID Teste": longo["ID Teste"].astype(str)})
+
+
+def resumo_missoes(longo):
+    """Pontuação máxima/média e total de testes por missão, num só group-by."""
+    return longo.groupby("Missão", observed=False).agg(
+        Pontuacao_Maxima=("Pontuação", "max"),
+        Pontuacao_Media=("Pontuação", "mean"),
+        Testes=("ID Teste", "nunique"),
+        Mudancas=("Mudança", "count"),
+    ).reset_index()
+
+
+def tipos_por_missao(longo):
+    """Contagem de cada ``Tipo`` de mudança por missão (formato longo)."""
+    return (
+        longo.groupby(["Missão", "Tipo"], observed=True)
+        .size()
+        .rename("Testes")
+        .reset_index()
+    )
@@ -0,0 +1,71 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# ===================== MOTORES =====================
+# Leituras vêm como "90º", "90°" ou "90". Todas as colunas de motor são
+# convertidas juntas, num único array Arrow: o caminho rápido só apara os
+# símbolos de grau; texto fora do padrão cai na extração por regex.
+_SIMBOLOS = "º° "
+_NUMERO = r"(?P<numero>-?\d+(?:[.,]\d+)?)"
+
+
+def colunas_motores(df):
+    return [c for c in df.columns if "Motor" in c]
+
+
+def _para_numeros(texto):
+    limpo = pc.replace_substring(pc.utf8_trim(texto, characters=_SIMBOLOS), ",", ".")
+    limpo = pc.if_else(pc.equal(limpo, ""), pa.scalar(None, pa.string()), limpo)
+    try:
+        return pc.cast(limpo, pa.float64())
+    except pa.ArrowInvalid:
+        numero = pc.struct_field(pc.extract_regex(texto, _NUMERO), [0])
+        return pc.cast(pc.replace_substring(numero, ",", "."), pa.float64())
+
+
+def parse_graus(df, colunas):
+    """Converte as colunas indicadas para números numa única passada vetorizada."""
+    bruto = pd.Series(df[colunas].to_numpy().ravel()).astype("string[pyarrow]")
+    numeros = _para_numeros(pa.chunked_array([pa.array(bruto)]))
+    valores = numeros.to_numpy().astype(float).reshape(len(df), len(colunas))
+
+    # Mantém inteiros quando todas as leituras são inteiras (caso comum)
+    if not np.isnan(valores).any() and np.array_equal(valores, np.round(valores)):
+        valores = valores.astype(np.int64)
+    return pd.DataFrame(valores, index=df.index, columns=colunas)
+
+
+def preparar_leituras(df):
+    """Normaliza a aba de motores: ``Rotacao`` numérica, motores e ``Alvo`` em graus."""
+    df = df.rename(columns=lambda c: c.strip())
+    df = df.rename(columns={df.columns[0]: "Rotacao"})
+
+    # "Rotação 1" → 1 (cai na extração por regex). ``assign`` devolve um
+    # frame novo sem tocar na aba compartilhada do atualizador.
+    colunas = colunas_motores(df) + ["Alvo"]
+    return df.assign(
+        Rotacao=parse_graus(df, ["Rotacao"])["Rotacao"],
+        **parse_graus(df, colunas)
+    )
+
+
+def metricas_motores(df, motores):
+    """Erro médio absoluto contra ``Alvo`` e desvio padrão de todos os motores de uma vez."""
+    leituras = df[motores].to_numpy(dtype=float)
+    alvo = df["Alvo"].to_numpy(dtype=float)[:, None]
+
+    with warnings.catch_warnings():
+        # Intervalos vazios ou com uma só rotação resultam em NaN, como no pandas
+        warnings.simplefilter("ignore", RuntimeWarning)
+        erro_medio = np.nanmean(np.abs(leituras - alvo), axis=0)
+        desvio = np.nanstd(leituras, axis=0, ddof=1)
+
+    return pd.DataFrame({
+        "Motor": motores,
+        "Erro Médio (°)": np.round(erro_medio, 2),
+        "Desvio Padrão": np.round(desvio, 2),
+    })
@@ -0,0 +1,128 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from core import snapshots
+
+# ===================== PLANILHA PUBLICADA =====================
+BASE_URL = (
+    "https://docs.google.com/spreadsheets/d/e/"
+    "2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub"
+)
+
+ROUNDS = "1674634257"
+MOTORES = "1089137814"
+ESTABILIDADE = "1610789898"
+GIRO = "2030734909"
+PID = "0"
+
+MISSOES = {
+    "M01": "1328389352","M02": "2081596503","M03": "1851247677",
+    "M04": "1520590222","M05": "1999701476","M06": "1653076161",
+    "M07": "1775788177","M08": "855854989","M09": "667614461",
+    "M10": "218456511","M11": "1002944230","M12": "1887688551",
+    "M13": "202334414","M14": "838222531","M15": "703330322",
+}
+
+SAIDAS = {
+    "Saída 1": "1008601803",
+    "Saída 2": "2064448046",
+    "Saída 3": "1760261047",
+    "Saída 4": "1456659526",
+    "Saída 5": "1257836641",
+}
+
+TIMEOUT = 15
+MAX_CONEXOES = 16
+# Snapshots mais novos que isso são usados sem ir à rede
+MAX_IDADE_SNAPSHOT = float(os.environ.get("DASHBOARD_SNAPSHOT_TTL", 600))
+
+_sessao = None
+_lock = threading.Lock()
+
+
+def url_csv(gid):
+    return f"{BASE_URL}?gid={gid}&single=true&output=csv"
+
+
+def sessao():
+    """Sessão HTTP compartilhada: todas as abas reaproveitam o mesmo pool de conexões."""
+    global _sessao
+    # Na carga a frio até MAX_CONEXOES threads chegam aqui ao mesmo tempo
+    with _lock:
+        if _sessao is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONEXOES)
+            s.mount("https://", adapter)
+            _sessao = s
+        return _sessao
+
+
+def baixar_aba(gid):
+    r = sessao().get(url_csv(gid), timeout=TIMEOUT)
+    r.raise_for_status()
+    r.encoding = "utf-8"
+    df = pd.read_csv(StringIO(r.text))
+    snapshots.salvar(gid, df)
+    return df
+
+
+def carregar_aba(gid, max_idade=MAX_IDADE_SNAPSHOT):
+    """Snapshot local se for recente; senão baixa. Sem rede, usa o último snapshot.
+
+    Com uma fonte local (DASHBOARD_FONTE, ver ``core.fontes``) lê direto dela.
+    """
+    from core.fontes import fonte
+
+    if not fonte().remota:
+        return fonte().ler(gid)
+
+    idade = snapshots.idade(gid)
+    if idade is not None and idade <= max_idade:
+        return snapshots.abrir(gid)
+
+    try:
+        return baixar_aba(gid)
+    except requests.RequestException:
+        df = snapshots.abrir(gid)
+        if df is None:
+            raise
+        return df
+
+
+def _carregar_cronometrado(gid, max_idade):
+    inicio = time.perf_counter()
+    df = carregar_aba(gid, max_idade)
+    return df, time.perf_counter() - inicio
+
+
+def carregar_lote(gids, max_idade=MAX_IDADE_SNAPSHOT, max_workers=MAX_CONEXOES, erros=None):
+    """Carrega várias abas em paralelo.
+
+    Retorna ``(frames, latencias)``: dicionários gid -> DataFrame e
+    gid -> segundos gastos para obter cada aba (snapshot ou rede).
+    Se ``erros`` for um dicionário, abas que falharem são registradas
+    nele em vez de interromper o lote.
+    """
+    gids = list(dict.fromkeys(gids))
+    frames, latencias = {}, {}
+    if not gids:
+        return frames, latencias
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(gids))) as pool:
+        futuros = {gid: pool.submit(_carregar_cronometrado, gid, max_idade) for gid in gids}
+        for gid, futuro in futuros.items():
+            try:
+                frames[gid], latencias[gid] = futuro.result()
+            except Exception as e:
+                if erros is None:
+                    raise
+                erros[gid] = e
+
+    return frames, latencias
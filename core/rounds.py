@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+# ===================== ROUNDS =====================
+MAXIMOS = {
+    'M01': 30,'M02': 30,'M03': 40,'M04': 40,'M05': 30,'M06': 30,
+    'M07': 30,'M08': 30,'M09': 30,'M10': 30,'M11': 30,'M12': 30,
+    'M13': 30,'M14': 35,'M15': 30
+}
+MAXIMO_PADRAO = 30
+
+
+def colunas_missoes(df):
+    return [col for col in df.columns if col.startswith('M')]
+
+
+class IndiceRounds:
+    """Rounds ordenados por ``Data`` com somas acumuladas por coluna.
+
+    Qualquer intervalo de datas vira um par de posições (``searchsorted``) e
+    soma, média e desvio de cada coluna saem de duas subtrações, sem
+    percorrer as linhas do intervalo.
+    """
+
+    def __init__(self, df, colunas):
+        self.df = df.sort_values("Data", kind="stable")
+        self.colunas = list(colunas)
+        self.datas = pd.to_datetime(self.df["Data"]).to_numpy()
+
+        valores = self.df[self.colunas].to_numpy(dtype=float)
+        validos = ~np.isnan(valores)
+        valores = np.where(validos, valores, 0.0)
+
+        zeros = np.zeros((1, len(self.colunas)))
+        self._soma = np.vstack([zeros, np.cumsum(valores, axis=0)])
+        self._quadrados = np.vstack([zeros, np.cumsum(valores ** 2, axis=0)])
+        self._contagem = np.vstack([zeros, np.cumsum(validos, axis=0)])
+
+    def intervalo(self, inicio, fim):
+        """Posições ``(i, j)`` das linhas com ``inicio <= Data <= fim``."""
+        inicio = np.datetime64(pd.Timestamp(inicio)).astype(self.datas.dtype)
+        fim = np.datetime64(pd.Timestamp(fim)).astype(self.datas.dtype)
+        i = int(np.searchsorted(self.datas, inicio, side="left"))
+        j = int(np.searchsorted(self.datas, fim, side="right"))
+        return i, max(i, j)
+
+    def linhas(self, i, j):
+        return self.df.iloc[i:j]
+
+    def _serie(self, valores):
+        return pd.Series(valores, index=self.colunas)
+
+    def somas(self, i, j):
+        return self._serie(self._soma[j] - self._soma[i])
+
+    def contagens(self, i, j):
+        return self._serie(self._contagem[j] - self._contagem[i])
+
+    def medias(self, i, j):
+        return self.somas(i, j) / self.contagens(i, j)
+
+    def desvios(self, i, j):
+        """Desvio padrão amostral (ddof=1), como ``Series.std``."""
+        n = self.contagens(i, j)
+        s = self.somas(i, j)
+        q = self._serie(self._quadrados[j] - self._quadrados[i])
+        variancia = ((q - s * s / n) / (n - 1)).clip(lower=0)
+        return np.sqrt(variancia.where(n > 1))
+
+
+def matrizes_falhas(df, colunas):
+    """Correlação entre missões e taxas de falha condicionais em uma passada.
+
+    Uma missão "falha" num round quando pontua zero. Retorna
+    ``(correlacao, condicional)``, onde ``condicional.loc[a, b]`` é a fração
+    dos rounds em que ``a`` falhou nos quais ``b`` também falhou.
+    """
+    valores = df[colunas].to_numpy(dtype=float)
+    falhas = (valores == 0).astype(float)
+
+    conjuntas = falhas.T @ falhas
+    por_missao = np.diag(conjuntas)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        condicional = conjuntas / por_missao[:, None]
+
+    # Cada par usa só os rounds em que as duas missões têm valor (como ``df.corr()``)
+    correlacao = pd.DataFrame(valores, columns=colunas).corr()
+    condicional = pd.DataFrame(condicional, index=colunas, columns=colunas)
+    return correlacao, condicional
+
+
+def precisao_missoes(indice, i, j):
+    """Precisão (%) de cada missão no intervalo: pontos obtidos / pontos possíveis."""
+    missoes = [c for c in indice.colunas if c.startswith('M')]
+    maximos = pd.Series({m: MAXIMOS.get(m, MAXIMO_PADRAO) for m in missoes}, dtype=float)
+    return indice.somas(i, j)[missoes] / ((j - i) * maximos) * 100
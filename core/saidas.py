@@ -0,0 +1,23 @@
+import pandas as pd
+
+# ===================== SAÍDAS =====================
+RENOMEAR = {
+    "nº teste": "Teste",
+    "Nº Teste": "Teste",
+    "pontuação": "Pontuação",
+    "mudança": "Mudança",
+    "resultado": "Resultado"
+}
+
+
+def preparar(df):
+    df = df.rename(columns=lambda c: c.strip())
+    return df.rename(columns=RENOMEAR)
+
+
+def taxa_sucesso(df):
+    """Percentual de tentativas com ``Resultado`` de sucesso ("Sucesso", "OK" ou "1")."""
+    if "Resultado" not in df.columns or len(df) == 0:
+        return 0
+    sucesso = df["Resultado"].astype(str).str.contains("Sucesso|OK|1", case=False, na=False)
+    return sucesso.sum() / len(df) * 100
@@ -0,0 +1,54 @@
+import os
+import time
+from pathlib import Path
+
+import pyarrow as pa
+
+# ===================== SNAPSHOTS EM DISCO =====================
+# Cada aba baixada é gravada como Arrow IPC (sem compressão) para ser
+# reaberta via memory map: reinícios do servidor não voltam a baixar
+# nem a fazer parse de CSV.
+CACHE_DIR = Path(os.environ.get(
+    "DASHBOARD_CACHE_DIR",
+    Path(__file__).resolve().parent.parent / ".cache"
+))
+DIRETORIO = CACHE_DIR / "snapshots"
+
+
+def caminho(gid):
+    return DIRETORIO / f"{gid}.arrow"
+
+
+def salvar(gid, df):
+    """Grava o snapshot de forma atômica. Retorna False se não foi possível."""
+    destino = caminho(gid)
+    tmp = destino.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tabela = pa.Table.from_pandas(df, preserve_index=False)
+        DIRETORIO.mkdir(parents=True, exist_ok=True)
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, tabela.schema) as writer:
+                writer.write_table(tabela)
+        os.replace(tmp, destino)
+    except (pa.ArrowException, OSError):
+        tmp.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def abrir(gid):
+    """Abre o snapshot memory-mapped; ``None`` se não existir."""
+    origem = caminho(gid)
+    if not origem.exists():
+        return None
+    with pa.memory_map(str(origem), "r") as fonte:
+        tabela = pa.ipc.open_file(fonte).read_all()
+    return tabela.to_pandas()
+
+
+def idade(gid):
+    """Segundos desde a última gravação do snapshot, ou ``None``."""
+    try:
+        return time.time() - caminho(gid).stat().st_mtime
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,74 @@
+import pandas as pd
+import streamlit as st
+
+# ===================== TABELA PAGINADA =====================
+# O st.dataframe serializa o frame inteiro para o navegador a cada rerun.
+# Aqui filtro e ordenação rodam no servidor, sobre o frame em cache, e só
+# as linhas da página atual são enviadas.
+TAMANHOS = [25, 50, 100, 250]
+TODAS = "Todas as colunas"
+
+
+def _voltar_inicio(key):
+    st.session_state[f"{key}__pagina"] = 1
+
+
+def filtrar(df, coluna, texto, indice=None):
+    """Linhas cuja ``coluna`` contém ``texto`` (sem diferenciar maiúsculas).
+
+    Com ``coluna == TODAS`` usa ``indice`` (ver ``core.busca``) para buscar na
+    linha inteira.
+    """
+    if not texto:
+        return df
+    if coluna == TODAS:
+        from core.busca import buscar
+        return df[buscar(indice.loc[df.index], texto)]
+    valores = df[coluna].astype(str).str.lower()
+    return df[valores.str.contains(texto.lower(), regex=False).fillna(False).to_numpy(dtype=bool)]
+
+
+def ordenar(df, coluna, crescente=True):
+    if coluna is None:
+        return df
+    return df.sort_values(coluna, ascending=crescente, kind="stable", na_position="last")
+
+
+def tabela_paginada(df, key, indice=None, tamanhos=TAMANHOS, **kwargs):
+    """Exibe ``df`` paginado, com busca e ordenação feitas no servidor.
+
+    ``indice`` é opcional: a série de ``construir_indice`` já em cache libera a
+    busca em todas as colunas. ``kwargs`` seguem para o ``st.dataframe``.
+    """
+    colunas = list(df.columns)
+    opcoes_filtro = ([TODAS] if indice is not None else []) + colunas
+
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+    with col1:
+        texto = st.text_input("Filtrar", key=f"{key}__texto", on_change=_voltar_inicio, args=(key,))
+    with col2:
+        coluna_filtro = st.selectbox("Coluna do filtro", opcoes_filtro, key=f"{key}__coluna", on_change=_voltar_inicio, args=(key,))
+    with col3:
+        coluna_ordem = st.selectbox("Ordenar por", [None] + colunas, key=f"{key}__ordem",
+                                    format_func=lambda c: "—" if c is None else c)
+    with col4:
+        crescente = st.toggle("Crescente", value=True, key=f"{key}__crescente")
+
+    visiveis = ordenar(filtrar(df, coluna_filtro, texto, indice), coluna_ordem, crescente)
+
+    col1, col2, col3 = st.columns([1, 1, 3])
+    with col1:
+        por_pagina = st.selectbox("Linhas por página", tamanhos, key=f"{key}__tamanho", on_change=_voltar_inicio, args=(key,))
+    total_paginas = max(1, -(-len(visiveis) // por_pagina))
+    if st.session_state.get(f"{key}__pagina", 1) > total_paginas:
+        st.session_state[f"{key}__pagina"] = total_paginas
+    with col2:
+        pagina = st.number_input(f"Página (de {total_paginas})", min_value=1, max_value=total_paginas, key=f"{key}__pagina")
+
+    inicio = (pagina - 1) * por_pagina
+    trecho = visiveis.iloc[inicio:inicio + por_pagina]
+    st.dataframe(trecho, **{"hide_index": True, "use_container_width": True, **kwargs})
+    with col3:
+        st.caption(f"Linhas {min(inicio + 1, len(visiveis))}–{inicio + len(trecho)} de {len(visiveis)}"
+                   + (f" (filtradas de {len(df)})" if len(visiveis) != len(df) else ""))
+    return trecho
@@ -0,0 +1,222 @@
+import csv
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.cache import CacheLRU
+from core.estatisticas import Acumulador
+from core.motores import colunas_motores, preparar_leituras
+
+# ===================== TELEMETRIA AO VIVO =====================
+# Acompanha um arquivo que cresce (CSV com cabeçalho ou uma linha JSON por
+# leitura), lendo só o que foi acrescentado desde a última consulta. As
+# leituras recentes ficam num buffer circular de tamanho fixo e as
+# estatísticas por motor são atualizadas só com as linhas novas.
+#
+# O arquivo vem da configuração, nunca de um campo de texto na página:
+# DASHBOARD_MOTORES_AO_VIVO aponta para um arquivo ou para um diretório, e
+# nesse caso só os arquivos de leitura dentro dele podem ser escolhidos.
+CAPACIDADE = 5000
+ORIGEM = Path(os.environ.get("DASHBOARD_MOTORES_AO_VIVO", "telemetria_motores.csv"))
+EXTENSOES = {".csv", ".json", ".jsonl", ".txt"}
+MAX_ARQUIVOS = 8
+
+
+class BufferCircular:
+    def __init__(self, capacidade, colunas):
+        self.capacidade = capacidade
+        self.dados = np.full((capacidade, colunas), np.nan)
+        self.total = 0
+
+    def adicionar(self, linhas):
+        linhas = np.asarray(linhas, dtype=float)
+        recebidas = len(linhas)
+        # Lote maior que o buffer: só a cauda é guardada, mas todas contam
+        linhas = linhas[-self.capacidade:]
+        pos = (self.total + recebidas - len(linhas)) % self.capacidade
+        primeira = min(len(linhas), self.capacidade - pos)
+        self.dados[pos:pos + primeira] = linhas[:primeira]
+        self.dados[:len(linhas) - primeira] = linhas[primeira:]
+        self.total += recebidas
+
+    def valores(self):
+        """Linhas guardadas em ordem cronológica."""
+        if self.total <= self.capacidade:
+            return self.dados[:self.total].copy()
+        pos = self.total % self.capacidade
+        return np.concatenate([self.dados[pos:], self.dados[:pos]])
+
+
+class LeitorCauda:
+    def __init__(self, caminho):
+        self.caminho = Path(caminho)
+        self.posicao = 0
+        self.cabecalho = None
+        self._resto = ""
+        self._pendente = None
+
+    def ler_novas(self):
+        """Linhas completas acrescentadas desde a última leitura, como dicionários.
+
+        Retorna ``(registros, invalidas)``; linhas que não são JSON/CSV válidos
+        são contadas em ``invalidas`` e descartadas. A posição só avança com
+        ``confirmar()``, depois que os registros foram processados.
+        """
+        try:
+            tamanho = self.caminho.stat().st_size
+        except FileNotFoundError:
+            return [], 0
+        posicao, cabecalho, resto = self.posicao, self.cabecalho, self._resto
+        if tamanho < posicao:
+            # Arquivo truncado/recriado: recomeça do início
+            posicao, cabecalho, resto = 0, None, ""
+
+        with open(self.caminho, "rb") as f:
+            f.seek(posicao)
+            bloco = f.read()
+
+        texto = resto + bloco.decode("utf-8", errors="replace")
+        *linhas, resto = texto.split("\n")
+
+        registros, invalidas = [], 0
+        for linha in linhas:
+            linha = linha.strip()
+            if not linha:
+                continue
+            try:
+                if linha.startswith("{"):
+                    registro = json.loads(linha)
+                    if not isinstance(registro, dict):
+                        raise ValueError("linha JSON não é um objeto")
+                elif cabecalho is None:
+                    cabecalho = next(csv.reader([linha]))
+                    continue
+                else:
+                    valores = next(csv.reader([linha]))
+                    if len(valores) != len(cabecalho):
+                        raise ValueError("número de campos diferente do cabeçalho")
+                    registro = dict(zip(cabecalho, valores))
+            except (ValueError, csv.Error):
+                invalidas += 1
+                continue
+            registros.append(registro)
+
+        self._pendente = (posicao + len(bloco), cabecalho, resto)
+        return registros, invalidas
+
+    def confirmar(self):
+        if self._pendente is not None:
+            self.posicao, self.cabecalho, self._resto = self._pendente
+            self._pendente = None
+
+
+class Telemetria:
+    def __init__(self, caminho, capacidade=CAPACIDADE):
+        self.leitor = LeitorCauda(caminho)
+        self.capacidade = capacidade
+        self.motores = None
+        self.buffer = None
+        self.erro = None
+        self.leituras = None
+        self.descartadas = 0
+        self.aviso = None
+        self._lock = threading.Lock()
+
+    def _valido(self, registro):
+        colunas = {str(c).strip() for c in registro}
+        if "Alvo" not in colunas or len(colunas) < 2:
+            return False
+        if self.motores is None:
+            return any("Motor" in c for c in colunas)
+        return colunas.issuperset(self.motores)
+
+    def atualizar(self):
+        """Processa as linhas novas; retorna quantas foram usadas.
+
+        Linhas malformadas ou sem ``Alvo``/motores são descartadas e contadas
+        em ``descartadas``; uma falha ao processar o lote fica em ``aviso`` e
+        o lote é relido na próxima consulta.
+        """
+        with self._lock:
+            registros, invalidas = self.leitor.ler_novas()
+            validos = [r for r in registros if self._valido(r)]
+            descartadas = invalidas + len(registros) - len(validos)
+            if not validos:
+                self.leitor.confirmar()
+                self._descartar(descartadas)
+                return 0
+
+            try:
+                df = preparar_leituras(pd.DataFrame(validos))
+                motores = self.motores or colunas_motores(df)
+                leituras = df[motores].to_numpy(dtype=float)
+                alvo = df["Alvo"].to_numpy(dtype=float)
+                rotacao = df["Rotacao"].to_numpy(dtype=float)
+            except (KeyError, ValueError, TypeError) as e:
+                self.aviso = f"Lote de leituras ignorado: {e}"
+                return 0
+
+            if self.motores is None:
+                self.motores = motores
+                self.buffer = BufferCircular(self.capacidade, len(self.motores) + 2)
+                self.erro = Acumulador(len(self.motores))
+                self.leituras = Acumulador(len(self.motores))
+
+            self.leitor.confirmar()
+            self.buffer.adicionar(np.column_stack([rotacao, leituras, alvo]))
+            self.erro.atualizar(np.abs(leituras - alvo[:, None]))
+            self.leituras.atualizar(leituras)
+            self.aviso = None
+            self._descartar(descartadas)
+            return len(df)
+
+    def _descartar(self, n):
+        if n:
+            self.descartadas += n
+            self.aviso = f"{self.descartadas} linha(s) inválida(s) ignorada(s) no arquivo de leituras"
+
+    def janela(self):
+        """Leituras recentes (até ``capacidade``) no formato da aba de motores."""
+        with self._lock:
+            if self.buffer is None:
+                return pd.DataFrame(columns=["Rotacao", "Alvo"])
+            return pd.DataFrame(self.buffer.valores(), columns=["Rotacao", *self.motores, "Alvo"])
+
+    def metricas(self):
+        """Erro médio e desvio por motor sobre todas as leituras já recebidas."""
+        with self._lock:
+            if self.motores is None:
+                return pd.DataFrame(columns=["Motor", "Erro Médio (°)", "Desvio Padrão"])
+            return pd.DataFrame({
+                "Motor": self.motores,
+                "Erro Médio (°)": np.round(self.erro.media, 2),
+                "Desvio Padrão": np.round(self.leituras.desvio, 2),
+            })
+
+
+_telemetrias = CacheLRU(max_itens=MAX_ARQUIVOS)
+
+
+def arquivos_disponiveis():
+    """Nomes que podem ser acompanhados: o arquivo configurado ou os do diretório."""
+    if ORIGEM.is_dir():
+        return sorted(
+            p.name for p in ORIGEM.iterdir()
+            if p.is_file() and p.suffix.lower() in EXTENSOES
+        )
+    return [ORIGEM.name]
+
+
+def telemetria(nome):
+    """Uma instância por arquivo, compartilhada entre as sessões.
+
+    ``nome`` precisa estar em ``arquivos_disponiveis()``.
+    """
+    if nome not in arquivos_disponiveis():
+        raise ValueError(f"Arquivo de leituras não configurado: {nome!r}")
+    caminho = (ORIGEM / nome if ORIGEM.is_dir() else ORIGEM).resolve()
+    return _telemetrias.obter(str(caminho), lambda: Telemetria(caminho))
@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
+
+from core.instrumentacao import finalizar, iniciar, marcar
 
 # =========================
 # CONFIG
@@ -11,6 +11,7 @@ st.set_page_config(
     page_icon="⚙️",
     layout="wide"
 )
+iniciar("estabilidade")
 
 # =========================
 # CSS MODERNO
@@ -69,71 +70,43 @@ st.markdown("""
 # =========================
 # CARREGAR PLANILHA
 # =========================
-url = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=1610789898&single=true&output=csv"
+marcar("carregar")
+from core.atualizador import atualizador
+from core.estabilidade import COLUNAS_OBRIGATORIAS, ResumoIncremental
+from core.memoria import painel_memoria
+from core.planilhas import ESTABILIDADE
 
-@st.cache_data
-def load_data():
-    return pd.read_csv(url)
+@st.cache_resource(max_entries=2)
+def load_data(versao):
+    return atualizador().obter(ESTABILIDADE)
 
-df = load_data()
+versao = atualizador().versao(ESTABILIDADE)
+df = load_data(versao)
+painel_memoria([ESTABILIDADE], {ESTABILIDADE: "Estabilidade"})
 
 # =========================
 # VALIDAR COLUNAS
 # =========================
-required_cols = [
-    "Teste","Velocidade","Distância Percorrida (mm)",
-    "Distância Alvo (mm)","Erro de Movimento (mm)",
-    "Guinada Final","Erro de Guinada","Tempo"
-]
-
-missing = [c for c in required_cols if c not in df.columns]
+missing = [c for c in COLUNAS_OBRIGATORIAS if c not in df.columns]
 if missing:
     st.error(f"❌ Estão faltando colunas na planilha: {missing}")
+    finalizar()
     st.stop()
 
-# =========================
-# TRATAR DADOS
-# =========================
-num_cols = [
-    "Velocidade","Distância Percorrida (mm)","Distância Alvo (mm)",
-    "Erro de Movimento (mm)","Guinada Final","Erro de Guinada","Tempo"
-]
-
-for c in num_cols:
-    df[c] = (
-        df[c].astype(str)
-        .str.replace(",", ".", regex=False)
-        .str.replace(" ", "", regex=False)
-    )
-    df[c] = pd.to_numeric(df[c], errors="coerce")
-
-df = df.dropna(subset=["Velocidade","Erro de Movimento (mm)","Erro de Guinada","Tempo"])
-
 # =========================
 # CÁLCULOS
 # =========================
-summary = df.groupby("Velocidade").agg(
-    Erro_Medio_Mov=("Erro de Movimento (mm)", "mean"),
-    Variacao_Mov=("Erro de Movimento (mm)", "std"),
-    Erro_Medio_Guinada=("Erro de Guinada", "mean"),
-    Variacao_Guinada=("Erro de Guinada", "std"),
-    Tempo_Medio=("Tempo","mean"),
-    Tempo_Minimo=("Tempo","min"),
-    Tempo_Maximo=("Tempo","max"),
-    Testes=("Teste", "count")
-).reset_index().fillna(0)
-
-summary["Score_Estabilidade"] = (
-    summary["Erro_Medio_Mov"].abs()
-    + summary["Variacao_Mov"]
-    + summary["Erro_Medio_Guinada"].abs()
-    + summary["Variacao_Guinada"]
-)
+marcar("resumo")
+@st.cache_resource
+def resumo_incremental():
+    return ResumoIncremental()
 
-summary["Score_Desempenho"] = (
-    summary["Score_Estabilidade"] * 0.7
-    + summary["Tempo_Medio"] * 0.3
-)
+@st.cache_resource(max_entries=2)
+def load_summary(versao):
+    # Só os testes novos desde a última versão são tratados e acumulados
+    return resumo_incremental().sincronizar(load_data(versao))
+
+summary = load_summary(versao)
 
 vel_estavel = summary.sort_values("Score_Estabilidade").iloc[0]
 vel_rapida = summary.sort_values("Tempo_Medio").iloc[0]
@@ -141,35 +114,47 @@ vel_melhor_geral = summary.sort_values("Score_Desempenho").iloc[0]
 
 # GRÁFICOS
 # =========================
+marcar("graficos")
+from core.figuras import figura
+
+import plotly.express as px
+
 st.subheader("📊 Ranking de Performance")
 
 with st.container():
-    fig = px.scatter(
+    fig = figura(("estabilidade_ranking", versao), lambda: px.scatter(
         summary,
         x="Velocidade",
         y="Score_Desempenho",
         size="Testes",
         color="Tempo_Medio",
         title="Desempenho Geral (Menor é Melhor)"
-    )
+    ))
     st.plotly_chart(fig, use_container_width=True)
 
 col4, col5 = st.columns(2)
 
 with col4:
     st.markdown("<div class='card'>", unsafe_allow_html=True)
-    fig2 = px.bar(summary, x="Velocidade", y="Tempo_Medio", title="⏱️ Tempo Médio por Velocidade")
+    fig2 = figura(("estabilidade_tempo", versao), lambda: px.bar(
+        summary, x="Velocidade", y="Tempo_Medio", title="⏱️ Tempo Médio por Velocidade"
+    ))
     st.plotly_chart(fig2, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 with col5:
     st.markdown("<div class='card'>", unsafe_allow_html=True)
-    fig3 = px.bar(summary, x="Velocidade", y="Score_Estabilidade", title="🎯 Estabilidade por Velocidade")
+    fig3 = figura(("estabilidade_score", versao), lambda: px.bar(
+        summary, x="Velocidade", y="Score_Estabilidade", title="🎯 Estabilidade por Velocidade"
+    ))
     st.plotly_chart(fig3, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =========================
 # TABELA FINAL
 # =========================
+marcar("tabela")
 st.subheader("📋 Tabela")
 st.dataframe(summary.style.format(precision=2), use_container_width=True, hide_index=True)
+
+finalizar()
@@ -1,12 +1,14 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+
+from core.instrumentacao import finalizar, iniciar, marcar
 
 # ===================== CONFIG =====================
 st.set_page_config(
     page_title="Análise de Giro | The Crew",
     layout="wide"
 )
+iniciar("giro")
 
 # ===================== CSS GLOBAL =====================
 st.markdown("""
@@ -60,27 +62,39 @@ st.markdown("""
 
 
 # ===================== LOAD DATA =====================
-CSV_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=2030734909&single=true&output=csv"
-
-@st.cache_data
-def load_data():
-    return pd.read_csv(CSV_URL)
-
-df = load_data()
-
-df["Erro Giro Velocidade Fixa (°)"] = abs(df["Alvo"] - df["Giro com Giroscópio"])
-df["Erro Giro Proporcional (°)"] = abs(df["Alvo"] - df["Giro Proporcional com Giroscópio"])
+marcar("carregar")
+from core.atualizador import atualizador
+from core.fontes import consultar, distintos, fonte
+from core.giro import adicionar_erros
+from core.memoria import painel_memoria
+from core.planilhas import GIRO
+
+@st.cache_resource(max_entries=2)
+def load_data(versao):
+    return adicionar_erros(atualizador().obter(GIRO))
+
+if fonte().pushdown:
+    # Banco local: só os ângulos escolhidos são lidos do SQLite
+    versao = fonte().versao()
+    df = None
+    opcoes = distintos(GIRO, versao, "Alvo")
+else:
+    versao = atualizador().versao(GIRO)
+    df = load_data(versao)
+    opcoes = df["Alvo"].unique()
+    painel_memoria([GIRO], {GIRO: "Giro"})
 
 
 # ===================== SIDEBAR =====================
+marcar("filtros")
 st.sidebar.header("🔎 Filtros")
 angulo = st.sidebar.multiselect(
     "Filtrar por ângulo alvo",
-    sorted(df["Alvo"].unique())
+    sorted(opcoes)
 )
 
-if angulo:
-    df = df[df["Alvo"].isin(angulo)]
+if angulo or df is None:
+    df = consultar(GIRO, versao, df, preparar=adicionar_erros, em={"Alvo": angulo} if angulo else None)
 
 
 # ===================== KPIs =====================
@@ -98,10 +112,13 @@ st.success(
 
 
 # ===================== TABELA =====================
+marcar("tabela")
 with st.container():
     st.markdown("### 📋 Dados dos Testes")
 
-    st.dataframe(
+    from core.tabelas import tabela_paginada
+
+    tabela_paginada(
         df[[
             "ID Teste",
             "Alvo",
@@ -112,48 +129,72 @@ with st.container():
             "Erro Giro Velocidade Fixa (°)",
             "Erro Giro Proporcional (°)"
         ]],
-        use_container_width=True,
-        hide_index=True
+        "giro_tabela"
     )
 
     st.markdown("</div>", unsafe_allow_html=True)
 
 
 # ===================== GRÁFICOS =====================
+marcar("graficos")
 st.markdown("### 📈 Análises Visuais")
 
+from core.cache import CacheLRU, hash_frame
+from core.graficos import png_matplotlib
+
+@st.cache_resource
+def cache_figuras():
+    # PNGs já renderizados, compartilhados entre sessões e limitados em tamanho
+    return CacheLRU(max_itens=48)
+
+chave = (hash_frame(df), tuple(sorted(angulo)))
+
 colA, colB = st.columns(2)
 
 # ---- Tempo ----
-with colA:
-    st.markdown("#### ⏱ Tempo médio")
-    fig1, ax1 = plt.subplots(figsize=(5, 2.5), dpi=120)
+def desenhar_tempo(ax1):
     ax1.bar(["Velocidade Fixa", "Proporcional"], [df["Tempo"].mean(), df["Tempo.1"].mean()])
     ax1.set_ylabel("Tempo (s)")
-    st.pyplot(fig1, use_container_width=True)
+
+with colA:
+    st.markdown("#### ⏱ Tempo médio")
+    st.image(
+        png_matplotlib(cache_figuras(), ("tempo", *chave), desenhar_tempo, figsize=(5, 2.5)),
+        use_container_width=True
+    )
     st.markdown("</div>", unsafe_allow_html=True)
 
 
 # ---- Erro ----
-with colB:
-    st.markdown("#### 🎯 Erro angular médio")
-    fig2, ax2 = plt.subplots(figsize=(5, 2.5), dpi=120)
+def desenhar_erro(ax2):
     ax2.bar(
         ["Velocidade Fixa", "Proporcional"],
         [df["Erro Giro Velocidade Fixa (°)"].mean(), df["Erro Giro Proporcional (°)"].mean()]
     )
     ax2.set_ylabel("Erro (graus)")
-    st.pyplot(fig2, use_container_width=True)
+
+with colB:
+    st.markdown("#### 🎯 Erro angular médio")
+    st.image(
+        png_matplotlib(cache_figuras(), ("erro", *chave), desenhar_erro, figsize=(5, 2.5)),
+        use_container_width=True
+    )
     st.markdown("</div>", unsafe_allow_html=True)
 
 
 # ---- Dispersão ----
+def desenhar_dispersao(ax3):
+    ax3.scatter(df["ID Teste"], df["Erro Giro Velocidade Fixa (°)"], label="Velocidade Fixa", alpha=0.7)
+    ax3.scatter(df["ID Teste"], df["Erro Giro Proporcional (°)"], label="Proporcional", alpha=0.7)
+    ax3.set_xlabel("ID do Teste")
+    ax3.set_ylabel("Erro (graus)")
+    ax3.legend()
+
 st.markdown("#### 📌 Dispersão do erro por teste")
-fig3, ax3 = plt.subplots(figsize=(7, 3), dpi=120)
-ax3.scatter(df["ID Teste"], df["Erro Giro Velocidade Fixa (°)"], label="Velocidade Fixa", alpha=0.7)
-ax3.scatter(df["ID Teste"], df["Erro Giro Proporcional (°)"], label="Proporcional", alpha=0.7)
-ax3.set_xlabel("ID do Teste")
-ax3.set_ylabel("Erro (graus)")
-ax3.legend()
-st.pyplot(fig3, use_container_width=True)
+st.image(
+    png_matplotlib(cache_figuras(), ("dispersao", *chave), desenhar_dispersao, figsize=(7, 3)),
+    use_container_width=True
+)
 st.markdown("</div>", unsafe_allow_html=True)
+
+finalizar()
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+
+from core.instrumentacao import finalizar, fragmento, iniciar, marcar
 
 # =========================
 # CONFIG
@@ -10,6 +11,7 @@ st.set_page_config(
     page_icon="🤖",
     layout="wide"
 )
+iniciar("missoes")
 
 # =========================
 # CSS MODERNO
@@ -68,93 +70,178 @@ st.markdown("""
 # =========================
 # BASE PLANILHA
 # =========================
-BASE_URL = (
-    "https://docs.google.com/spreadsheets/d/e/"
-    "2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub"
-)
-
-MISSOES = {
-    "M01": "1328389352","M02": "2081596503","M03": "1851247677",
-    "M04": "1520590222","M05": "1999701476","M06": "1653076161",
-    "M07": "1775788177","M08": "855854989","M09": "667614461",
-    "M10": "218456511","M11": "1002944230","M12": "1887688551",
-    "M13": "202334414","M14": "838222531","M15": "703330322",
-}
+marcar("carregar")
+from core.atualizador import atualizador
+from core.figuras import figura
+from core.memoria import painel_memoria
+from core.planilhas import MISSOES
+
+@st.cache_resource(max_entries=2)
+def carregar_missoes(versoes):
+    # Todas as abas vêm do atualizador: trocar de missão não volta à rede
+    return {gid: atualizador().obter(gid) for gid in MISSOES.values()}
+
+@st.cache_resource(max_entries=2)
+def carregar_todas(versoes):
+    # Um único frame longo para todas as missões, cacheado como unidade
+    from core.missoes import juntar_missoes
+    return juntar_missoes({nome: atualizador().obter(gid) for nome, gid in MISSOES.items()})
+
+versoes = tuple(atualizador().versao(g) for g in MISSOES.values())
+missoes_df = carregar_missoes(versoes)
+latencias = atualizador().latencias
+
+with st.sidebar.expander("⏱️ Latência por aba"):
+    st.dataframe(
+        pd.DataFrame({
+            "Missão": list(MISSOES.keys()),
+            "Latência (ms)": [round(latencias.get(g, 0) * 1000) for g in MISSOES.values()],
+        }),
+        hide_index=True,
+        use_container_width=True
+    )
+painel_memoria(MISSOES.values(), {gid: nome for nome, gid in MISSOES.items()})
+
+modo = st.radio("Visualização", ["Uma missão", "Todas as missões"], horizontal=True)
+
+# =========================
+# TODAS AS MISSÕES
+# =========================
+if modo == "Todas as missões":
+    marcar("todas")
+    from core.missoes import resumo_missoes, tipos_por_missao
+
+    import plotly.express as px
+    longo = carregar_todas(versoes)
+    resumo = resumo_missoes(longo)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("🏁 Maior Pontuação", int(longo["Pontuação"].max()))
+    col2.metric("📊 Média Geral", round(longo["Pontuação"].mean(), 1))
+    col3.metric("🧪 Total de Testes", int(resumo["Testes"].sum()))
+
+    st.subheader("📦 Distribuição de Pontuação por Missão")
+    fig_dist = figura(
+        ("missoes_distribuicao", versoes),
+        lambda: px.box(longo, x="Missão", y="Pontuação", color="Missão", points=False)
+        .update_layout(showlegend=False)
+    )
+    st.plotly_chart(fig_dist, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("🧪 Testes por Missão")
+        fig_testes = figura(
+            ("missoes_testes", versoes),
+            lambda: px.bar(resumo, x="Missão", y="Testes", text_auto=True)
+        )
+        st.plotly_chart(fig_testes, use_container_width=True)
+    with col2:
+        st.subheader("📊 Tipos de Mudança por Missão")
+        fig_mix = figura(
+            ("missoes_tipos", versoes),
+            lambda: px.bar(tipos_por_missao(longo), x="Missão", y="Testes", color="Tipo")
+        )
+        st.plotly_chart(fig_mix, use_container_width=True)
+
+    st.dataframe(
+        resumo.rename(columns={
+            "Pontuacao_Maxima": "Pontuação Máxima",
+            "Pontuacao_Media": "Pontuação Média",
+            "Mudancas": "Mudanças",
+        }).round(1),
+        hide_index=True,
+        use_container_width=True
+    )
+    finalizar()
+    st.stop()
 
 # =========================
 # SELEÇÃO DE MISSÃO
 # =========================
-missao = st.selectbox("Selecione a Missão", list(MISSOES.keys()))
-
-@st.cache_data
-def carregar_missao(gid):
-    url = f"{BASE_URL}?gid={gid}&single=true&output=csv"
-    return pd.read_csv(url)
-
-df = carregar_missao(MISSOES[missao])
-
-# =========================
-# ORGANIZAÇÃO
-# =========================
-df["ID Teste"] = df["ID Teste"].astype(str)
-df = df.sort_values("ID Teste")
-
-# =========================
-# KPIs
-# =========================
-col1, col2, col3 = st.columns(3)
-
-col1.metric("🏁 Pontuação Máxima", int(df["Pontuação"].max()))
-col2.metric("📊 Média de Pontuação", round(df["Pontuação"].mean(), 1))
-col3.metric("🧪 Total de Testes", df["ID Teste"].nunique())
-
-st.write("")
-
-# =========================
-# GRÁFICO PRINCIPAL
-# =========================
-st.subheader("📈 Evolução de Pontuação")
-
-fig = px.scatter(
-    df,
-    x="ID Teste",
-    y="Pontuação",
-    title=f"Pontuação por Teste – {missao}",
-)
-st.plotly_chart(fig, use_container_width=True)
-
-# =========================
-# HISTÓRICO DE MUDANÇAS
-# =========================
-st.subheader("🔧 Histórico Técnico de Mudanças")
-
-mudancas = df[df["Mudança"].notna() & (df["Mudança"].astype(str).str.strip() != "")]
-
-if mudancas.empty:
-    st.info("Nenhuma mudança registrada ainda para esta missão.")
-else:
-    for _, row in mudancas.iterrows():
-        with st.expander(f"🧪 Teste {row['ID Teste']} – Resultado: {row['Resultado']}"):
-            st.markdown(f"""
-            <div class="card">
-                <b>🎯 Pontuação:</b> {row['Pontuação']}<br>
-                <b>🔎 Tipo:</b> {row['Tipo']}<br><br>
-                <b>🛠️ O que foi alterado:</b><br>
-                {row['Mudança']}
-            </div>
-            """, unsafe_allow_html=True)
-
-# =========================
-# TIPO DE MUDANÇAS
-# =========================
-st.subheader("📊 Tipos de Mudança")
-
-fig_tipo = px.histogram(
-    df,
-    x="Tipo",
-    color="Tipo",
-    text_auto=True,
-    title="Distribuição de Tipos de Alteração"
-)
-st.plotly_chart(fig_tipo, use_container_width=True)
-st.markdown("</div>", unsafe_allow_html=True)
+# Fragmento: trocar de missão só reexecuta esta parte da página
+@st.fragment
+@fragmento("missoes", "missao")
+def secao_missao(missoes_df, versoes):
+    missao = st.selectbox("Selecione a Missão", list(MISSOES.keys()))
+
+    df = missoes_df[MISSOES[missao]]
+    versao = versoes[MISSOES[missao]]
+
+    # =========================
+    # ORGANIZAÇÃO
+    # =========================
+    marcar("transformar")
+    df = df.assign(**{"ID Teste": df["ID Teste"].astype(str)})
+    df = df.sort_values("ID Teste")
+
+    # =========================
+    # KPIs
+    # =========================
+    col1, col2, col3 = st.columns(3)
+
+    col1.metric("🏁 Pontuação Máxima", int(df["Pontuação"].max()))
+    col2.metric("📊 Média de Pontuação", round(df["Pontuação"].mean(), 1))
+    col3.metric("🧪 Total de Testes", df["ID Teste"].nunique())
+
+    st.write("")
+
+    # =========================
+    # GRÁFICO PRINCIPAL
+    # =========================
+    marcar("graficos")
+    st.subheader("📈 Evolução de Pontuação")
+
+    import plotly.express as px
+
+    fig = figura(("missao_pontuacao", missao, versao), lambda: px.scatter(
+        df,
+        x="ID Teste",
+        y="Pontuação",
+        title=f"Pontuação por Teste – {missao}",
+    ))
+    st.plotly_chart(fig, use_container_width=True)
+
+    # =========================
+    # HISTÓRICO DE MUDANÇAS
+    # =========================
+    marcar("historico")
+    st.subheader("🔧 Histórico Técnico de Mudanças")
+
+    mudancas = df[df["Mudança"].notna() & (df["Mudança"].astype(str).str.strip() != "")]
+
+    if mudancas.empty:
+        st.info("Nenhuma mudança registrada ainda para esta missão.")
+    else:
+        for _, row in mudancas.iterrows():
+            with st.expander(f"🧪 Teste {row['ID Teste']} – Resultado: {row['Resultado']}"):
+                st.markdown(f"""
+                <div class="card">
+                    <b>🎯 Pontuação:</b> {row['Pontuação']}<br>
+                    <b>🔎 Tipo:</b> {row['Tipo']}<br><br>
+                    <b>🛠️ O que foi alterado:</b><br>
+                    {row['Mudança']}
+                </div>
+                """, unsafe_allow_html=True)
+
+    # =========================
+    # TIPO DE MUDANÇAS
+    # =========================
+    marcar("graficos")
+    st.subheader("📊 Tipos de Mudança")
+
+    fig_tipo = figura(("missao_tipos", missao, versao), lambda: px.histogram(
+        df,
+        x="Tipo",
+        color="Tipo",
+        text_auto=True,
+        title="Distribuição de Tipos de Alteração"
+    ))
+    st.plotly_chart(fig_tipo, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+# Versões lidas junto com os dados: o fragmento reexecuta sem recarregá-los
+secao_missao(missoes_df, dict(zip(MISSOES.values(), versoes)))
+
+finalizar()
@@ -1,12 +1,13 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
+
+from core.instrumentacao import finalizar, iniciar, marcar
 
 # =========================================
 # CONFIG
 # =========================================
 st.set_page_config(page_title="Motor Analysis | The Crew", layout="wide")
+iniciar("motores")
 
 # =========================================
 # CSS
@@ -61,99 +62,151 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# =========================================
+# MODO AO VIVO
+# =========================================
+marcar("ao_vivo")
+st.sidebar.header("📡 Ao vivo")
+ao_vivo = st.sidebar.toggle("Acompanhar leituras em tempo real")
+
+if ao_vivo:
+    from core.graficos import linha
+    from core.telemetria import ORIGEM, arquivos_disponiveis, telemetria
+
+    # Só arquivos da origem configurada (DASHBOARD_MOTORES_AO_VIVO) podem ser escolhidos
+    arquivos = arquivos_disponiveis()
+    if not arquivos:
+        st.sidebar.warning(f"Nenhum arquivo de leituras em `{ORIGEM}`.")
+        finalizar()
+        st.stop()
+    arquivo = st.sidebar.selectbox("Arquivo de leituras", arquivos)
+    intervalo = st.sidebar.slider("Atualizar a cada (s)", 1, 10, 2)
+
+    @st.fragment(run_every=intervalo)
+    def painel_ao_vivo():
+        tel = telemetria(arquivo)
+        tel.atualizar()
+        if tel.aviso:
+            st.warning(tel.aviso)
+
+        janela = tel.janela()
+        if janela.empty:
+            st.info(f"Aguardando leituras em `{arquivo}`...")
+            return
+
+        st.markdown("### 📈 Leituras ao vivo")
+        st.caption(f"{tel.buffer.total} leituras recebidas — exibindo as últimas {len(janela)}")
+        fig_vivo = linha(
+            janela,
+            x="Rotacao",
+            y=tel.motores,
+            labels={"value": "Grau", "variable": "Motor"},
+            title="Motores em tempo real"
+        )
+        for alvo in sorted(janela["Alvo"].dropna().unique()):
+            fig_vivo.add_hline(y=alvo, line_dash="dot", annotation_text=f"{alvo:g}°")
+        st.plotly_chart(fig_vivo, use_container_width=True)
+
+        st.markdown("### 📊 Estatísticas acumuladas")
+        st.dataframe(tel.metricas(), hide_index=True, use_container_width=True)
+
+    painel_ao_vivo()
+    finalizar()
+    st.stop()
+
 # =========================================
 # LOAD DATA
 # =========================================
-url = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=1089137814&single=true&output=csv"
-
-@st.cache_data
-def load_data():
-    df = pd.read_csv(url)
-    df.columns = df.columns.str.strip()   # limpa espaços
-    return df
-
-df = load_data()
-
-# Limpa nomes das colunas
-df.columns = df.columns.str.strip()
-
-# ==== ARRUMA PRIMEIRA COLUNA ====
-first_col = df.columns[0]
-df.rename(columns={first_col: "Rotacao"}, inplace=True)
-
-# Converte "Rotação 1" → 1
-df["Rotacao"] = df["Rotacao"].astype(str).str.extract(r'(\d+)').astype(int)
-
-# ==== ARRUMA MOTORES ====
-motores = [c for c in df.columns if "Motor" in c]
+marcar("carregar")
+from core.atualizador import atualizador
+from core.fontes import consultar, contar, distintos, fonte
+from core.figuras import figura
+from core.graficos import filtrar_zoom, linha, mostrar_grafico, zoom_atual
+from core.motores import colunas_motores, metricas_motores, parse_graus, preparar_leituras
+from core.memoria import painel_memoria
+from core.planilhas import MOTORES
+
+@st.cache_resource(max_entries=2)
+def load_data(versao):
+    # Limpeza e conversão das leituras acontecem uma vez por versão dos dados
+    return preparar_leituras(atualizador().obter(MOTORES))
+
+if fonte().pushdown:
+    # Banco local: a aba nunca é carregada inteira, só a faixa escolhida
+    versao = fonte().versao()
+    df = None
+    total = contar(MOTORES, versao)
+    alvos = pd.DataFrame({"Alvo": distintos(MOTORES, versao, "Alvo")})
+    alvos = parse_graus(alvos, ["Alvo"])["Alvo"]
+else:
+    versao = atualizador().versao(MOTORES)
+    df = load_data(versao)
+    total = len(df)
+    alvos = df["Alvo"]
+    painel_memoria([MOTORES], {MOTORES: "Motores"})
+alvos = sorted(alvos.dropna().unique())
 
-for m in motores:
-    df[m] = (
-        df[m]
-        .astype(str)
-        .str.replace("º","", regex=False)
-        .str.replace("°","", regex=False)
-        .astype(int)
-    )
-
-# Garante coluna Alvo numérica
-df["Alvo"] = df["Alvo"].astype(int)
 # =========================================
 # SIDEBAR
 # =========================================
+marcar("filtros")
 st.sidebar.header("🔎 Filtros")
 
-total = len(df)
-inicio = st.sidebar.slider("Início da Rotação", 1, total, 1)
-fim = st.sidebar.slider("Fim da Rotação", 1, total, total)
+# Faixa única dentro de um form: só recalcula ao clicar em "Aplicar"
+with st.sidebar.form("filtros_motores"):
+    inicio, fim = st.slider("Faixa de Rotações", 1, total, (1, total))
+    st.form_submit_button("Aplicar", use_container_width=True)
 
-df_filtrado = df.iloc[inicio-1:fim]
+df_filtrado = consultar(MOTORES, versao, df, preparar=preparar_leituras, linhas=(inicio - 1, fim))
+motores = colunas_motores(df_filtrado)
 
 # =========================================
 # TABELA
 # =========================================
+marcar("tabela")
 st.markdown("### 📋 Leituras dos Motores (dados reais)")
-st.dataframe(df_filtrado, hide_index=True, use_container_width=True)
+from core.tabelas import tabela_paginada
+tabela_paginada(df_filtrado, "motores_tabela")
 
 # =========================================
 # GRÁFICO PRINCIPAL
 # =========================================
+marcar("graficos")
 st.markdown("### 📈 Alinhamento dos Motores com o Alvo")
 
-df_plot = df_filtrado.melt(
-    id_vars=["Rotacao", "Alvo"],
-    value_vars=motores,
-    var_name="Motor",
-    value_name="Grau"
-)
-
-fig = px.line(
-    df_plot,
-    x="Rotacao",
-    y="Grau",
-    color="Motor",
-    markers=True,
-    title="Desempenho dos Motores ao longo das Rotações"
-)
+# Formato largo: uma série por motor, sem derreter o dataframe
+df_plot = filtrar_zoom(df_filtrado, "Rotacao", "motores_alinhamento")
+
+def desenhar_alinhamento():
+    fig = linha(
+        df_plot,
+        x="Rotacao",
+        y=motores,
+        markers=True,
+        labels={"value": "Grau", "variable": "Motor"},
+        title="Desempenho dos Motores ao longo das Rotações"
+    )
 
-# linhas de referência
-for alvo in sorted(df["Alvo"].unique()):
-    fig.add_hline(y=alvo, line_dash="dot", annotation_text=f"{alvo}°")
+    # linhas de referência
+    for alvo in alvos:
+        fig.add_hline(y=alvo, line_dash="dot", annotation_text=f"{alvo}°")
+    return fig
 
-st.plotly_chart(fig, use_container_width=True)
+fig = figura(
+    ("motores_alinhamento", versao, inicio, fim, zoom_atual("motores_alinhamento")),
+    desenhar_alinhamento
+)
+mostrar_grafico(fig, "motores_alinhamento")
 
 # =========================================
 # MÉTRICAS
 # =========================================
+marcar("metricas")
 st.markdown("### 📊 Estatísticas dos Motores")
 
-metricas = []
-for motor in motores:
-    erro_medio = (df_filtrado[motor] - df_filtrado["Alvo"]).abs().mean()
-    desvio = df_filtrado[motor].std()
-    metricas.append([motor, round(erro_medio,2), round(desvio,2)])
+import plotly.express as px
 
-metrics_df = pd.DataFrame(metricas, columns=["Motor","Erro Médio (°)","Desvio Padrão"])
+metrics_df = metricas_motores(df_filtrado, motores)
 
 col1, col2 = st.columns(2)
 
@@ -161,19 +214,20 @@ with col1:
     st.dataframe(metrics_df.sort_values("Erro Médio (°)"), hide_index=True, use_container_width=True)
 
 with col2:
-    fig2 = px.bar(
+    fig2 = figura(("motores_erro", versao, inicio, fim), lambda: px.bar(
         metrics_df,
         x="Motor",
         y="Erro Médio (°)",
         title="Erro Médio por Motor",
         color="Erro Médio (°)",
         color_continuous_scale="Blues"
-    )
+    ))
     st.plotly_chart(fig2, use_container_width=True)
 
 # =========================================
 # ASSISTENTE
 # =========================================
+marcar("assistente")
 st.markdown("### 🤖 Assistente de Diagnóstico")
 
 melhor = metrics_df.sort_values("Erro Médio (°)").iloc[0]
@@ -188,3 +242,4 @@ st.markdown(f"- ⚠️ Pior desempenho: **{pior['Motor']}** (Erro médio {pior['
 if pior["Erro Médio (°)"] > 5:
     st.markdown("- 🔧 Sugestão: revisar calibração e folga mecânica do pior motor.")
 
+finalizar()
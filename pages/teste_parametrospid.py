@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
-import requests
+
+from core.instrumentacao import finalizar, iniciar, marcar
 
 # -------------------------------
 # CONFIGURAÇÃO DA PÁGINA
@@ -10,6 +11,7 @@ st.set_page_config(
     page_icon="📊",
     layout="wide"
 )
+iniciar("parametrospid")
 
 # -------------------------------
 # CSS MODERNO
@@ -66,34 +68,65 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # -------------------------------
-# LINK DA PLANILHA CSV
+# ABA DA PLANILHA
 # -------------------------------
-url = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=0&single=true&output=csv"
+marcar("carregar")
+from core.atualizador import atualizador
+from core.busca import buscar, construir_indice
+from core.fontes import colunas, consultar, distintos, fonte
+from core.memoria import painel_memoria
+from core.planilhas import PID
 
 # -------------------------------
 # LER PLANILHA
 # -------------------------------
-@st.cache_data
-def load_data(url):
-    df = pd.read_csv(url)
+@st.cache_resource(max_entries=2)
+def load_data(versao):
+    df = atualizador().obter(PID)
     return df
 
-df = load_data(url)
+@st.cache_resource(max_entries=2)
+def load_indice(versao):
+    return construir_indice(load_data(versao))
+
+@st.cache_resource(max_entries=8)
+def consultar_indice(versao, resultados):
+    # Banco local: só os resultados escolhidos saem do SQLite, já com o índice de busca
+    df = consultar(PID, versao, None, em={"Resultado": resultados} if resultados else None)
+    return df, construir_indice(df)
+
+if fonte().pushdown:
+    versao = fonte().versao()
+else:
+    versao = atualizador().versao(PID)
+    df = load_data(versao)
+    painel_memoria([PID], {PID: "PID"})
 
 # -------------------------------
 # SIDEBAR - FILTROS
 # -------------------------------
+marcar("filtros")
 st.sidebar.header("🔎 Filtros")
-search = st.sidebar.text_input("Buscar em qualquer campo")
-
-if search:
-    df = df[df.apply(lambda row: row.astype(str).str.contains(search, case=False).any(), axis=1)]
+search = st.sidebar.text_input("Buscar em qualquer campo", help="Vários termos: mostra testes que contêm todos")
+
+if fonte().pushdown:
+    # Filtro por resultado se existir
+    resultado_sel = []
+    if "Resultado" in colunas(PID, versao):
+        resultado_sel = st.sidebar.multiselect("Filtrar por resultado", sorted(distintos(PID, versao, "Resultado")))
+    df, indice = consultar_indice(versao, tuple(resultado_sel))
+    if search:
+        df = df[buscar(indice, search)]
+else:
+    indice = load_indice(versao)
+    if search:
+        df = df[buscar(indice, search)]
 
-# Filtro por resultado se existir
-if "Resultado" in df.columns:
-    resultado_sel = st.sidebar.multiselect("Filtrar por resultado", sorted(df["Resultado"].dropna().unique()))
-    if resultado_sel:
-        df = df[df["Resultado"].isin(resultado_sel)]
+    # Filtro por resultado se existir
+    if "Resultado" in df.columns:
+        resultado_sel = st.sidebar.multiselect("Filtrar por resultado", sorted(df["Resultado"].dropna().unique()))
+        if resultado_sel:
+            df = consultar(PID, versao, df, em={"Resultado": resultado_sel})
 
 # -------------------------------
 # KPIs
@@ -112,18 +145,18 @@ st.write("")
 # -------------------------------
 # TABELA PRINCIPAL (limpa)
 # -------------------------------
+marcar("tabela")
 st.subheader("📋 Visão Geral dos Testes")
 
+from core.tabelas import tabela_paginada
+
 df_exibir = df.drop(columns=["Antes", "Depois"], errors="ignore")
-st.dataframe(
-    df_exibir,
-    use_container_width=True,
-    hide_index=True
-)
+tabela_paginada(df_exibir, "pid_tabela", indice=indice)
 
 # -------------------------------
 # LISTA DE MUDANÇAS
 # -------------------------------
+marcar("mudancas")
 st.write("")
 st.subheader("🛠️ Ajustes Aplicados nos Testes")
 
@@ -132,7 +165,20 @@ mudancas = df[df["Mudança"].notna() & (df["Mudança"].astype(str).str.strip() !
 if mudancas.empty:
     st.info("Nenhuma mudança registrada nos testes até agora.")
 else:
-    for i, row in mudancas.iterrows():
+    colP1, colP2 = st.columns([1, 3])
+    with colP1:
+        por_pagina = st.selectbox("Ajustes por página", [10, 20, 50], index=0)
+    total_paginas = max(1, -(-len(mudancas) // por_pagina))
+    with colP2:
+        pagina = st.number_input(
+            f"Página (de {total_paginas})",
+            min_value=1,
+            max_value=total_paginas,
+            value=1
+        )
+
+    # Só os ajustes da página atual viram expanders
+    for i, row in mudancas.iloc[(pagina - 1) * por_pagina : pagina * por_pagina].iterrows():
         with st.expander(f"Teste {row['ID Teste']} — {row['Mudança']}"):
             st.markdown(f"""
             <div class="change-card">
@@ -144,3 +190,5 @@ else:
                 <b>Valores Depois:</b> {row.get('Depois','-')}
             </div>
             """, unsafe_allow_html=True)
+
+finalizar()
@@ -1,16 +1,14 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 
-import requests
-from PIL import Image
-from io import BytesIO
+from core.instrumentacao import finalizar, fragmento, iniciar, marcar
 
 # ===================== CONFIG =====================
 st.set_page_config(
     page_title="Rounds | The Crew",
     layout="wide"
 )
+iniciar("rounds")
 
 # ===================== CSS GLOBAL =====================
 st.markdown("""
@@ -64,29 +62,55 @@ st.markdown("""
 
 
 # ===================== LOAD DATA =====================
-url = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=1674634257&single=true&output=csv"
-
-@st.cache_data
-def load_data(url):
-    df = pd.read_csv(url)
-    df['Data'] = pd.to_datetime(df['Data'], dayfirst=True).dt.date
-    return df
-
-df = load_data(url)
+marcar("carregar")
+from core.atualizador import atualizador
+from core.figuras import figura
+from core.graficos import filtrar_zoom, linha, mostrar_grafico, zoom_atual
+from core.rounds import MAXIMOS, MAXIMO_PADRAO, IndiceRounds, colunas_missoes, matrizes_falhas, precisao_missoes
+from core.memoria import painel_memoria
+from core.planilhas import ROUNDS
+
+def preparar(df):
+    df = df.assign(Data=pd.to_datetime(df['Data'], dayfirst=True).dt.date)
+    return df.sort_values('Data', kind='stable')
+
+@st.cache_resource(max_entries=2)
+def load_data(versao):
+    return preparar(atualizador().obter(ROUNDS))
+
+@st.cache_resource(max_entries=2)
+def load_indice(versao):
+    df = load_data(versao)
+    return IndiceRounds(df, colunas_missoes(df) + ['Total'])
+
+versao = atualizador().versao(ROUNDS)
+df = load_data(versao)
+indice = load_indice(versao)
+painel_memoria([ROUNDS], {ROUNDS: "Rounds"})
+
+@st.cache_resource(max_entries=2)
+def load_matrizes(versao):
+    df = load_data(versao)
+    return matrizes_falhas(df, colunas_missoes(df))
 
 
 # ===================== SIDEBAR =====================
+marcar("filtros")
 st.sidebar.header("🔎 Filtros")
 
 min_date = df['Data'].min()
 max_date = df['Data'].max()
 
-data_range = st.sidebar.date_input(
-    "Selecione o período:",
-    value=(min_date, max_date),
-    min_value=min_date,
-    max_value=max_date
-)
+# Dentro de um form o período só é aplicado ao clicar em "Aplicar", e não
+# a cada data escolhida no calendário
+with st.sidebar.form("filtros_rounds"):
+    data_range = st.date_input(
+        "Selecione o período:",
+        value=(min_date, max_date),
+        min_value=min_date,
+        max_value=max_date
+    )
+    st.form_submit_button("Aplicar", use_container_width=True)
 
 if isinstance(data_range, tuple):
     if len(data_range) == 1:
@@ -96,98 +120,118 @@ if isinstance(data_range, tuple):
 else:
     start_date = end_date = data_range
 
-df_filtrado = df[
-    (df['Data'] >= start_date) &
-    (df['Data'] <= end_date)
-]
+i, j = indice.intervalo(start_date, end_date)
+# Tudo de que os gráficos filtrados dependem, para a chave do cache de figuras
+filtros = (versao, start_date, end_date)
+# O índice precisa da aba inteira (totais e limites de data), então o período
+# sai dele mesmo em memória, também quando a fonte é SQLite
+df_filtrado = indice.linhas(i, j)
 
 
 # ===================== TABELA =====================
+marcar("tabela")
 st.markdown("### 📋 Tabela de Rounds")
-st.dataframe(df_filtrado, use_container_width=True, hide_index=True)
+from core.tabelas import tabela_paginada
+tabela_paginada(df_filtrado, "rounds_tabela")
 st.markdown("</div>", unsafe_allow_html=True)
 
-def load_drive_image(url):
-    file_id = url.split("/d/")[1].split("/")[0]
-    download_url = f"https://drive.google.com/uc?export=download&id={file_id}"
-
-    headers = {"User-Agent": "Mozilla/5.0"}
-    r = requests.get(download_url, headers=headers)
-
-    if r.status_code != 200:
-        return None
-
-    return Image.open(BytesIO(r.content))
+def mostrar_imagem(conteudo):
+    if conteudo is None:
+        st.caption("Imagem indisponível")
+    else:
+        st.image(conteudo, width=280)
 
 
 st.write("")
-st.subheader("🛠️ Histórico de Evoluções")
-
-mudancas = df_filtrado[df_filtrado["Observação"].notna() & (df_filtrado["Observação"].astype(str).str.strip() != "")]
-
-if mudancas.empty:
-    st.info("Nenhuma mudança registrada até agora.")
-else:
-    for i, row in mudancas.iterrows():
-        titulo = f"📅 {row['Data']} — {row.get('Round','Round')} | {row['Observação'][:60]}..."
-
-        with st.expander(titulo):
-            st.markdown(f"""
-            <div style="
-                background:#f8fafc;
-                border:1px solid #e5e7eb;
-                border-radius:12px;
-                padding:16px;
-                margin-bottom:10px;
-            ">
-                <b>📝 Alteração:</b><br>{row['Observação']}<br><br>
-            </div>
-            """, unsafe_allow_html=True)
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.markdown("### Antes")
-                st.image(load_drive_image(row['Antes']), width=280)
-
-            with col2:
-                st.markdown("### Depois")
-                st.image(load_drive_image(row['Depois']), width=280)
-
-
+# Fragmento: paginar o histórico só reexecuta esta seção (e só baixa as
+# imagens da página nova)
+@st.fragment
+@fragmento("rounds", "historico")
+def secao_historico(df_filtrado):
+    marcar("historico")
+    st.subheader("🛠️ Histórico de Evoluções")
+
+    mudancas = df_filtrado[df_filtrado["Observação"].notna() & (df_filtrado["Observação"].astype(str).str.strip() != "")]
+
+    if mudancas.empty:
+        st.info("Nenhuma mudança registrada até agora.")
+    else:
+        from core.imagens import carregar_miniaturas
+
+        colP1, colP2 = st.columns([1, 3])
+        with colP1:
+            por_pagina = st.selectbox("Mudanças por página", [5, 10, 20], index=0)
+        total_paginas = max(1, -(-len(mudancas) // por_pagina))
+        with colP2:
+            pagina = st.number_input(
+                f"Página (de {total_paginas})",
+                min_value=1,
+                max_value=total_paginas,
+                value=1
+            )
+
+        # Só as mudanças da página atual são renderizadas e têm imagens baixadas
+        visiveis = mudancas.iloc[(pagina - 1) * por_pagina : pagina * por_pagina]
+        imagens = carregar_miniaturas(list(visiveis["Antes"]) + list(visiveis["Depois"]))
+
+        for i, row in visiveis.iterrows():
+            titulo = f"📅 {row['Data']} — {row.get('Round','Round')} | {row['Observação'][:60]}..."
+
+            with st.expander(titulo):
+                st.markdown(f"""
+                <div style="
+                    background:#f8fafc;
+                    border:1px solid #e5e7eb;
+                    border-radius:12px;
+                    padding:16px;
+                    margin-bottom:10px;
+                ">
+                    <b>📝 Alteração:</b><br>{row['Observação']}<br><br>
+                </div>
+                """, unsafe_allow_html=True)
+
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    st.markdown("### Antes")
+                    mostrar_imagem(imagens.get(row['Antes']))
+
+                with col2:
+                    st.markdown("### Depois")
+                    mostrar_imagem(imagens.get(row['Depois']))
+
+
+secao_historico(df_filtrado)
 
 
 # ===================== EVOLUÇÃO TOTAL =====================
+marcar("graficos")
 st.markdown("### 📈 Evolução da Pontuação Total")
 
-fig_total = px.line(
-    df_filtrado,
+df_total = filtrar_zoom(df_filtrado, 'Data', 'rounds_total')
+fig_total = figura(('rounds_total', *filtros, zoom_atual('rounds_total')), lambda: linha(
+    df_total,
     x='Data',
     y='Total',
     markers=True,
     title="Pontuação Total ao longo do tempo",
     range_y=[0, 545]
-)
-st.plotly_chart(fig_total, use_container_width=True)
+))
+mostrar_grafico(fig_total, 'rounds_total')
 
 st.markdown("</div>", unsafe_allow_html=True)
 
 
 # ===================== EFICIÊNCIA =====================
 st.markdown("### 🎯 Eficiência por Missão")
-missoes = [col for col in df_filtrado.columns if col.startswith('M')]
 
-maximos = {
-    'M01': 30,'M02': 30,'M03': 40,'M04': 40,'M05': 30,'M06': 30,
-    'M07': 30,'M08': 30,'M09': 30,'M10': 30,'M11': 30,'M12': 30,
-    'M13': 30,'M14': 35,'M15': 30
-}
+import plotly.express as px
+missoes = colunas_missoes(df_filtrado)
 
-for m in missoes:
-    if m not in maximos:
-        maximos[m] = 30
+maximos = {m: MAXIMOS.get(m, MAXIMO_PADRAO) for m in missoes}
 
-precisao = {m: df_filtrado[m].sum() / (len(df_filtrado) * maximos[m]) * 100 for m in missoes}
+# Somas do intervalo vêm do índice acumulado, sem varrer df_filtrado
+precisao = precisao_missoes(indice, i, j)[missoes].to_dict()
 
 precisao_df = pd.DataFrame({
     'Missão': precisao.keys(),
@@ -200,7 +244,7 @@ with col1:
     st.dataframe(precisao_df, hide_index=True, use_container_width=True)
 
 with col2:
-    fig_precisao = px.bar(
+    fig_precisao = figura(('rounds_precisao', *filtros), lambda: px.bar(
         precisao_df,
         x='Missão',
         y='Precisão (%)',
@@ -208,40 +252,89 @@ with col2:
         title="Precisão Média por Missão",
         color='Precisão (%)',
         color_continuous_scale='Blues'
-    )
+    ))
     st.plotly_chart(fig_precisao, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 
 # ===================== ANÁLISE POR MISSÃO =====================
+marcar("graficos")
 st.markdown("### 🔍 Análise Detalhada por Missão")
 
-selected_missao = st.selectbox("Escolha a missão", missoes)
+# Fragmento: trocar a missão ou o zoom não refaz os outros gráficos
+@st.fragment
+@fragmento("rounds", "missao")
+def secao_missao(df_filtrado, missoes, maximos, filtros):
+    selected_missao = st.selectbox("Escolha a missão", missoes)
+
+    df_single = filtrar_zoom(df_filtrado, 'Data', 'rounds_missao')
+    chave = ('rounds_missao', *filtros, selected_missao, zoom_atual('rounds_missao'))
+    fig_single = figura(chave, lambda: linha(
+        df_single,
+        x='Data',
+        y=selected_missao,
+        markers=True,
+        title=f"Pontuação da {selected_missao} ao longo do tempo",
+        range_y=[0, maximos[selected_missao]]
+    ))
+    mostrar_grafico(fig_single, 'rounds_missao')
 
-fig_single = px.line(
-    df_filtrado,
-    x='Data',
-    y=selected_missao,
-    markers=True,
-    title=f"Pontuação da {selected_missao} ao longo do tempo",
-    range_y=[0, maximos[selected_missao]]
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+secao_missao(df_filtrado, missoes, maximos, filtros)
+
+
+# ===================== FALHAS EM CONJUNTO =====================
+marcar("matrizes")
+st.markdown("### 🧩 Relação entre Missões")
+st.caption("Calculado sobre todos os rounds registrados. Uma missão falha quando pontua zero.")
+
+correlacao, condicional = load_matrizes(versao)
+
+visao = st.radio(
+    "Visualizar",
+    ["Falha condicional", "Correlação de pontuação"],
+    horizontal=True
 )
-st.plotly_chart(fig_single, use_container_width=True)
 
-st.markdown("</div>", unsafe_allow_html=True)
+def desenhar_falhas():
+    if visao == "Falha condicional":
+        return px.imshow(
+            condicional * 100,
+            text_auto=".0f",
+            color_continuous_scale="Reds",
+            zmin=0,
+            zmax=100,
+            labels={"x": "Também falhou", "y": "Quando falhou", "color": "%"},
+            title="Quando a missão da linha zera, % de vezes que a da coluna também zera"
+        )
+    return px.imshow(
+        correlacao,
+        text_auto=".2f",
+        color_continuous_scale="RdBu",
+        zmin=-1,
+        zmax=1,
+        title="Correlação entre as pontuações das missões"
+    )
+
+fig_falhas = figura(('rounds_falhas', versao, visao), desenhar_falhas)
+st.plotly_chart(fig_falhas, use_container_width=True)
 
 
 # ===================== ASSISTENTE =====================
+marcar("assistente")
 melhor_missao = precisao_df.loc[precisao_df['Precisão (%)'].idxmax()]
 pior_missao = precisao_df.loc[precisao_df['Precisão (%)'].idxmin()]
 
 if len(df_filtrado) > 1:
-    total_diff = df_filtrado['Total'].iloc[-1] - df_filtrado['Total'].iloc[0]
+    # float: 'Total' pode estar compactado num inteiro estreito
+    total_diff = float(df_filtrado['Total'].iloc[-1]) - float(df_filtrado['Total'].iloc[0])
     tendencia = "subindo 📈" if total_diff > 0 else "caindo 📉" if total_diff < 0 else "estável ➖"
 else:
     tendencia = "sem dados suficientes"
 
-desvios = {m: df_filtrado[m].std() for m in missoes}
+desvios = indice.desvios(i, j)[missoes].to_dict()
 missao_irregular = max(desvios, key=desvios.get)
 
 recomendacoes = []
@@ -266,3 +359,5 @@ st.markdown("### 🤖 Crew Assistente")
 for r in recomendacoes:
     st.markdown(f"- {r}")
 st.markdown("</div>", unsafe_allow_html=True)
+
+finalizar()
@@ -1,12 +1,14 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+
+from core.instrumentacao import finalizar, fragmento, iniciar, marcar
 
 # ===================== CONFIG =====================
 st.set_page_config(
     page_title="Saídas | The Crew",
     layout="wide"
 )
+iniciar("saidas")
 
 # ===================== CSS GLOBAL =====================
 st.markdown("""
@@ -58,91 +60,108 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ===================== LINKS =====================
-saidas_links = {
-    "Saída 1": "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=1008601803&single=true&output=csv",
-    "Saída 2": "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=2064448046&single=true&output=csv",
-    "Saída 3": "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=1760261047&single=true&output=csv",
-    "Saída 4": "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=1456659526&single=true&output=csv",
-    "Saída 5": "https://docs.google.com/spreadsheets/d/e/2PACX-1vTRuYovKK1C-FEzJDE5CzN5cubXHqZuXzGzvD69XQa7Lj15PKZfmmzyRC8zpyjhq7hst0yEYHJdWYYM/pub?gid=1257836641&single=true&output=csv"
-}
+from core.atualizador import atualizador
+from core.figuras import figura
+from core.graficos import filtrar_zoom, linha, mostrar_grafico, zoom_atual
+from core.memoria import painel_memoria
+from core.planilhas import SAIDAS
+from core.saidas import preparar, taxa_sucesso
 
 # ===================== SIDEBAR =====================
-colA, colB, colC = st.columns([2,1,1])
-
-with colA:
-    saida_escolhida = st.selectbox(
-        "Escolha a Saída a ser analisada:",
-        list(saidas_links.keys()),
-        index=0
+marcar("carregar")
+
+@st.cache_resource(max_entries=2)
+def load_data(versoes):
+    return {gid: preparar(atualizador().obter(gid)) for gid in SAIDAS.values()}
+
+versoes = tuple(atualizador().versao(g) for g in SAIDAS.values())
+saidas_df = load_data(versoes)
+latencias = atualizador().latencias
+
+with st.sidebar.expander("⏱️ Latência por aba"):
+    st.dataframe(
+        pd.DataFrame({
+            "Saída": list(SAIDAS.keys()),
+            "Latência (ms)": [round(latencias.get(g, 0) * 1000) for g in SAIDAS.values()],
+        }),
+        hide_index=True,
+        use_container_width=True
     )
+painel_memoria(SAIDAS.values(), {gid: nome for nome, gid in SAIDAS.items()})
 
-@st.cache_data
-def load_data(url):
-    df = pd.read_csv(url)
-    df.columns = [c.strip() for c in df.columns]
-
-    rename_map = {
-        "nº teste": "Teste",
-        "Nº Teste": "Teste",
-        "pontuação": "Pontuação",
-        "mudança": "Mudança",
-        "resultado": "Resultado"
-    }
-    df.rename(columns=rename_map, inplace=True)
-
-    return df
-
-df = load_data(saidas_links[saida_escolhida])
-
-# ===================== TABELA =====================
-st.markdown(f"### 📋 Tabela - {saida_escolhida}")
-st.dataframe(df, use_container_width=True, hide_index=True)
-
-# ===================== EVOLUÇÃO DA PONTUAÇÃO =====================
-st.markdown("### 📈 Evolução da Pontuação")
-
-fig = px.line(
-    df,
-    x="Teste",
-    y="Pontuação",
-    markers=True,
-    title=f"Evolução da Pontuação - {saida_escolhida}"
-)
-st.plotly_chart(fig, use_container_width=True)
+# ===================== SAÍDA SELECIONADA =====================
+# Fragmento: trocar de saída (ou mexer na tabela/zoom) só reexecuta esta parte
+@st.fragment
+@fragmento("saidas", "saida")
+def secao_saida(saidas_df, versoes):
+    colA, colB, colC = st.columns([2,1,1])
+
+    with colA:
+        saida_escolhida = st.selectbox(
+            "Escolha a Saída a ser analisada:",
+            list(SAIDAS.keys()),
+            index=0
+        )
+
+    df = saidas_df[SAIDAS[saida_escolhida]]
+
+    # ===================== TABELA =====================
+    marcar("tabela")
+    st.markdown(f"### 📋 Tabela - {saida_escolhida}")
+    from core.tabelas import tabela_paginada
+    tabela_paginada(df, f"saidas_tabela_{SAIDAS[saida_escolhida]}")
+
+    # ===================== EVOLUÇÃO DA PONTUAÇÃO =====================
+    marcar("graficos")
+    st.markdown("### 📈 Evolução da Pontuação")
+
+    chave = f"saidas_evolucao_{SAIDAS[saida_escolhida]}"
+    df_plot = filtrar_zoom(df, "Teste", chave)
+    fig = figura((chave, versoes[SAIDAS[saida_escolhida]], zoom_atual(chave)), lambda: linha(
+        df_plot,
+        x="Teste",
+        y="Pontuação",
+        markers=True,
+        title=f"Evolução da Pontuação - {saida_escolhida}"
+    ))
+    mostrar_grafico(fig, chave)
+
+    # ===================== TAXA DE SUCESSO =====================
+    st.markdown("### 🎯 Taxa de Sucesso")
+
+    taxa = taxa_sucesso(df)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Tentativas", len(df))
+    with col2:
+        st.metric("Taxa de Sucesso (%)", f"{taxa:.1f}%")
 
-# ===================== TAXA DE SUCESSO =====================
-st.markdown("### 🎯 Taxa de Sucesso")
+    # ===================== CREW ASSISTENTE =====================
+    marcar("assistente")
+    st.markdown("### 🤖 Crew Assistente — Insights")
 
-if "Resultado" in df.columns:
-    sucesso = df[df["Resultado"].astype(str).str.contains("Sucesso|OK|1", case=False, na=False)]
-    taxa = (len(sucesso) / len(df)) * 100 if len(df) > 0 else 0
-else:
-    taxa = 0
+    recomendacoes = []
 
-col1, col2 = st.columns(2)
-with col1:
-    st.metric("Tentativas", len(df))
-with col2:
-    st.metric("Taxa de Sucesso (%)", f"{taxa:.1f}%")
+    if taxa < 60:
+        recomendacoes.append("⚠️ Taxa de sucesso baixa. Revisar estratégia e consistência da saída.")
+    elif taxa > 85:
+        recomendacoes.append("✅ Excelente taxa de sucesso! Manter abordagem atual.")
 
-# ===================== CREW ASSISTENTE =====================
-st.markdown("### 🤖 Crew Assistente — Insights")
+    if df["Pontuação"].std() > 10:
+        recomendacoes.append("⚡ Pontuação muito instável. Trabalhar padronização da execução.")
 
-recomendacoes = []
+    if df["Pontuação"].mean() < df["Pontuação"].max() * 0.6:
+        recomendacoes.append("🎯 Ainda há grande espaço para melhorar a média de pontuação.")
 
-if taxa < 60:
-    recomendacoes.append("⚠️ Taxa de sucesso baixa. Revisar estratégia e consistência da saída.")
-elif taxa > 85:
-    recomendacoes.append("✅ Excelente taxa de sucesso! Manter abordagem atual.")
+    if len(recomendacoes) == 0:
+        recomendacoes.append("👌 Tudo consistente até agora. Continuar monitorando.")
 
-if df["Pontuação"].std() > 10:
-    recomendacoes.append("⚡ Pontuação muito instável. Trabalhar padronização da execução.")
+    for r in recomendacoes:
+        st.markdown(f"- {r}")
 
-if df["Pontuação"].mean() < df["Pontuação"].max() * 0.6:
-    recomendacoes.append("🎯 Ainda há grande espaço para melhorar a média de pontuação.")
 
-if len(recomendacoes) == 0:
-    recomendacoes.append("👌 Tudo consistente até agora. Continuar monitorando.")
+# Versões lidas junto com os dados: o fragmento reexecuta sem recarregá-los
+secao_saida(saidas_df, dict(zip(SAIDAS.values(), versoes)))
 
-for r in recomendacoes:
-    st.markdown(f"- {r}")
+finalizar()